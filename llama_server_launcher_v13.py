@@ -5,66 +5,205 @@ Supports persistent settings per GGUF file, process management, and command prev
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 import os
 import json
 import subprocess
 import signal
 import shlex
+import shutil
+import functools
 import threading
+import queue
+import codecs
+import mmap
+import struct
+import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict
+
+# Optional GGUF analysis libraries, imported on first use rather than at startup
+# (llama_cpp loads a large native library). None means "not probed yet".
+# llama-cpp-python for GGUF analysis
+Llama = None
+LLAMA_CPP_AVAILABLE: Optional[bool] = None
+# gguf library for direct metadata reading (more reliable)
+GGUFReader = None
+GGUFValueType = None
+GGUF_READER_AVAILABLE: Optional[bool] = None
+
+
+def _ensure_llama_cpp() -> bool:
+    """Import llama-cpp-python on first call; return whether it is available."""
+    global Llama, LLAMA_CPP_AVAILABLE
+    if LLAMA_CPP_AVAILABLE is None:
+        try:
+            from llama_cpp import Llama
+            LLAMA_CPP_AVAILABLE = True
+        except ImportError:
+            LLAMA_CPP_AVAILABLE = False
+    return LLAMA_CPP_AVAILABLE
+
+
+def _ensure_gguf_reader() -> bool:
+    """Import the gguf library on first call; return whether it is available."""
+    global GGUFReader, GGUFValueType, GGUF_READER_AVAILABLE
+    if GGUF_READER_AVAILABLE is None:
+        try:
+            from gguf import GGUFReader, GGUFValueType
+            GGUF_READER_AVAILABLE = True
+        except ImportError:
+            GGUF_READER_AVAILABLE = False
+    return GGUF_READER_AVAILABLE
+
+# Try to import psutil for the "kill all" fallback (falls back to pkill)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
-# Try to import llama-cpp-python for GGUF analysis
+# Try to import orjson for faster config parsing (falls back to the json module)
 try:
-    from llama_cpp import Llama
-    LLAMA_CPP_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    LLAMA_CPP_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
-# Try to import gguf library for direct metadata reading (more reliable)
+# Try to import msgpack for the metadata cache file (falls back to JSON)
 try:
-    from gguf import GGUFReader
-    GGUF_READER_AVAILABLE = True
+    import msgpack
+    MSGPACK_AVAILABLE = True
 except ImportError:
-    GGUF_READER_AVAILABLE = False
+    MSGPACK_AVAILABLE = False
 
 # Configuration file path
 CONFIG_FILE = os.path.expanduser("~/.llama_server_launcher_config.json")
 DEFAULT_LLAMA_SERVER_PATH = os.path.expanduser("~/llama.cpp/llama-server")
 
-
-class SafeVar:
-    """Wrapper for Tkinter variables that handles empty/invalid values gracefully."""
-
-    @staticmethod
-    def get_int(var: tk.StringVar, default: int = 0) -> int:
-        """Safely get integer value from a StringVar."""
-        try:
-            value = var.get().strip()
-            if value == "" or value == "-":
-                return default
-            return int(value)
-        except (tk.TclError, ValueError):
-            return default
-
-    @staticmethod
-    def get_float(var: tk.StringVar, default: float = 0.0) -> float:
-        """Safely get float value from a StringVar."""
-        try:
-            value = var.get().strip()
-            if value == "" or value == "-" or value == ".":
-                return default
-            return float(value)
-        except (tk.TclError, ValueError):
-            return default
-
-    @staticmethod
-    def get_str(var: tk.StringVar, default: str = "") -> str:
-        """Safely get string value from a StringVar."""
+# Persistent GGUF metadata cache. Bump the version whenever the analysis result format changes.
+META_CACHE_FILE = os.path.expanduser("~/.llama_server_launcher_meta_cache.json")
+META_CACHE_PACK_FILE = os.path.expanduser("~/.llama_server_launcher_meta_cache.msgpack")
+META_CACHE_VERSION = 1
+# Most recently used entries kept in the metadata cache
+META_CACHE_MAX_ENTRIES = 1000
+
+# Terminal emulators tried for "Run in Terminal", in order of preference.
+# The command string to run is appended as the final argument.
+TERMINALS = [
+    ["gnome-terminal", "--", "bash", "-c"],
+    ["konsole", "-e", "bash", "-c"],
+    ["xfce4-terminal", "-e", "bash -c"],
+    ["xterm", "-e", "bash", "-c"],
+]
+
+# Maximum number of models shown in the dropdown at once; type in Search to narrow the list
+MAX_COMBO_ITEMS = 500
+
+# Characters that require an argument to be shell-quoted in the command preview
+# (whitespace, quotes, expansions, glob patterns and other shell metacharacters)
+_SHELL_SPECIAL_CHARS = frozenset(' \t\n\'"\\$`!*?[]{}();&|<>')
+
+# Byte sets deleted with bytes.translate to test GGUF byte strings for letters in C
+_ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+_NON_ASCII_BYTES = bytes(range(128, 256))
+
+
+def _has_letter(raw: bytes, decoded: str) -> bool:
+    """Return True if decoded (the UTF-8 decoding of raw) contains any alphabetic character."""
+    rest = raw.translate(None, _ASCII_NON_LETTERS)
+    if not rest:
+        return False
+    if rest.translate(None, _NON_ASCII_BYTES):
+        # An ASCII letter survived
+        return True
+    # Only non-ASCII bytes are left - check the decoded characters themselves
+    return any(c.isalpha() for c in decoded)
+
+
+# GGUF metadata value types (see the GGUF spec in the llama.cpp repository)
+_GGUF_FIXED_TYPES = {
+    0: struct.Struct("<B"),   # UINT8
+    1: struct.Struct("<b"),   # INT8
+    2: struct.Struct("<H"),   # UINT16
+    3: struct.Struct("<h"),   # INT16
+    4: struct.Struct("<I"),   # UINT32
+    5: struct.Struct("<i"),   # INT32
+    6: struct.Struct("<f"),   # FLOAT32
+    7: struct.Struct("<?"),   # BOOL
+    10: struct.Struct("<Q"),  # UINT64
+    11: struct.Struct("<q"),  # INT64
+    12: struct.Struct("<d"),  # FLOAT64
+}
+_GGUF_STRING = 8
+_GGUF_ARRAY = 9
+_GGUF_HEADER = struct.Struct("<4sIQQ")  # magic, version, tensor count, metadata entry count
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_ARRAY_HEADER = struct.Struct("<IQ")  # element type, element count
+
+
+def _read_gguf_value(buf, offset: int, value_type: int) -> tuple[Any, int]:
+    """
+    Decode one GGUF metadata value at offset and return (value, offset past it).
+    Arrays are skipped without materializing them: numeric arrays yield their last
+    element (as GGUFReader's last part would), string and nested arrays yield None.
+    """
+    fixed = _GGUF_FIXED_TYPES.get(value_type)
+    if fixed is not None:
+        return fixed.unpack_from(buf, offset)[0], offset + fixed.size
+    if value_type == _GGUF_STRING:
+        (length,) = _U64.unpack_from(buf, offset)
+        start = offset + 8
+        return bytes(buf[start:start + length]).decode("utf-8", errors="ignore"), start + length
+    if value_type == _GGUF_ARRAY:
+        element_type, count = _ARRAY_HEADER.unpack_from(buf, offset)
+        offset += _ARRAY_HEADER.size
+        fixed = _GGUF_FIXED_TYPES.get(element_type)
+        if fixed is not None:
+            end = offset + count * fixed.size
+            value = fixed.unpack_from(buf, end - fixed.size)[0] if count else None
+            return value, end
+        if element_type == _GGUF_STRING:
+            for _ in range(count):
+                offset += 8 + _U64.unpack_from(buf, offset)[0]
+            return None, offset
+        for _ in range(count):
+            _, offset = _read_gguf_value(buf, offset, element_type)
+        return None, offset
+    raise ValueError(f"Unknown GGUF value type {value_type}")
+
+
+def _iter_gguf_metadata(path: str):
+    """
+    Yield (key, value) for each metadata entry of a GGUF v2/v3 file, reading the
+    header through a read-only memory map. Stop iterating (and close the generator)
+    to stop reading - tensor data is never touched.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        magic, version, _, kv_count = _GGUF_HEADER.unpack_from(buf, 0)
+        if magic != b"GGUF" or version not in (2, 3):
+            raise ValueError(f"Unsupported GGUF header (magic {magic!r}, version {version})")
+        offset = _GGUF_HEADER.size
+        for _ in range(kv_count):
+            (key_length,) = _U64.unpack_from(buf, offset)
+            offset += 8
+            key = bytes(buf[offset:offset + key_length]).decode("utf-8", errors="ignore")
+            offset += key_length
+            (value_type,) = _U32.unpack_from(buf, offset)
+            value, offset = _read_gguf_value(buf, offset + 4, value_type)
+            yield key, value
+
+
+class SafeStringVar(tk.StringVar):
+    """StringVar with a bound accessor that handles empty/invalid values gracefully."""
+
+    def get_str(self, default: str = "") -> str:
+        """Safely get the stripped string value."""
         try:
-            return var.get().strip()
+            return self.get().strip()
         except tk.TclError:
             return default
 
@@ -72,6 +211,160 @@ class SafeVar:
 class LlamaServerLauncher:
     """Main application class for Llama Server Launcher."""
 
+    # Command-line options in the order they are emitted by build_command.
+    # Each entry is (flag, variable attribute, kind, extra):
+    #   "str"      - emit flag and value when the string variable is non-empty
+    #   "flag"     - emit flag alone when the boolean variable is set
+    #   "flag_val" - emit flag followed by extra when the boolean variable is set
+    #   "gated"    - emit flag and the string value when the boolean variable named by extra is set
+    CMD_SPEC = (
+        # Common parameters
+        ("--host", "host_var", "str", None),
+        ("--port", "port_var", "str", None),
+        ("-ngl", "ngl_var", "str", None),
+        ("-ncmoe", "ncmoe_var", "str", None),
+        ("--jinja", "jinja_var", "flag", None),
+        ("--threads", "threads_var", "str", None),
+        ("--ctx-size", "ctx_size_var", "str", None),
+        ("--temp", "temp_var", "str", None),
+        ("--min-p", "min_p_var", "str", None),
+        ("--top-p", "top_p_var", "str", None),
+        ("--top-k", "top_k_var", "str", None),
+        ("--presence-penalty", "presence_penalty_var", "str", None),
+        # Additional parameters
+        ("--mmproj", "mmproj_path_var", "str", None),
+        # OpenAI-compatible API settings
+        ("--api-key", "api_key_var", "str", None),
+        ("--alias", "model_alias_var", "str", None),
+        ("--chat-template", "chat_template_var", "str", None),
+        ("--chat-template-file", "chat_template_file_var", "str", None),
+        ("-b", "batch_size_var", "str", None),
+        ("-ub", "ubatch_size_var", "str", None),
+        ("--parallel", "parallel_var", "str", None),
+        ("-n", "n_predict_var", "str", None),
+        ("--repeat-penalty", "repeat_penalty_var", "str", None),
+        ("--frequency-penalty", "frequency_penalty_var", "str", None),
+        ("--rope-freq-base", "rope_freq_base_var", "str", None),
+        ("--rope-freq-scale", "rope_freq_scale_var", "str", None),
+        # KV Cache settings
+        ("--cache-type-k", "cache_type_k_var", "str", None),
+        ("--cache-type-v", "cache_type_v_var", "str", None),
+        # Speculative decoding settings
+        ("--spec-type", "spec_type_var", "gated", "spec_type_enabled_var"),
+        ("--spec-draft-n-max", "spec_draft_n_max_var", "gated", "spec_draft_n_max_enabled_var"),
+        # Flags
+        ("-fa", "flash_attn_var", "flag_val", "on"),
+        ("--mlock", "mlock_var", "flag", None),
+        ("--no-mmap", "no_mmap_var", "flag", None),
+        ("-cb", "cont_batching_var", "flag", None),
+        ("--metrics", "metrics_var", "flag", None),
+        ("--verbose", "verbose_var", "flag", None),
+        ("--log-disable", "log_disable_var", "flag", None),
+        ("--no-mmproj-offload", "no_mmproj_offload_var", "flag", None),
+        ("--no-mmproj", "no_mmproj_var", "flag", None),
+        ("--cpu-moe", "cpu_moe_var", "flag", None),
+    )
+
+    # Settings persisted per model/preset: (settings key, variable attribute, default)
+    SETTINGS_SPEC = (
+        ("host", "host_var", "0.0.0.0"),
+        ("port", "port_var", "8033"),
+        ("ngl", "ngl_var", "99"),
+        ("ncmoe", "ncmoe_var", ""),
+        ("jinja", "jinja_var", True),
+        ("threads", "threads_var", "-1"),
+        ("ctx_size", "ctx_size_var", "8192"),
+        ("temp", "temp_var", "0.7"),
+        ("min_p", "min_p_var", "0.0"),
+        ("top_p", "top_p_var", "0.9"),
+        ("top_k", "top_k_var", "40"),
+        ("presence_penalty", "presence_penalty_var", "0.0"),
+        ("mmproj", "mmproj_path_var", ""),
+        ("api_key", "api_key_var", ""),
+        ("model_alias", "model_alias_var", ""),
+        ("chat_template", "chat_template_var", ""),
+        ("chat_template_file", "chat_template_file_var", ""),
+        ("batch_size", "batch_size_var", ""),
+        ("ubatch_size", "ubatch_size_var", ""),
+        ("parallel", "parallel_var", ""),
+        ("n_predict", "n_predict_var", ""),
+        ("repeat_penalty", "repeat_penalty_var", ""),
+        ("frequency_penalty", "frequency_penalty_var", ""),
+        ("rope_freq_base", "rope_freq_base_var", ""),
+        ("rope_freq_scale", "rope_freq_scale_var", ""),
+        ("cache_type_k", "cache_type_k_var", ""),
+        ("cache_type_v", "cache_type_v_var", ""),
+        ("flash_attn", "flash_attn_var", False),
+        ("mlock", "mlock_var", False),
+        ("no_mmap", "no_mmap_var", False),
+        ("cont_batching", "cont_batching_var", True),
+        ("metrics", "metrics_var", False),
+        ("verbose", "verbose_var", False),
+        ("log_disable", "log_disable_var", False),
+        ("no_mmproj_offload", "no_mmproj_offload_var", False),
+        ("no_mmproj", "no_mmproj_var", False),
+        ("cpu_moe", "cpu_moe_var", False),
+        ("custom_args", "custom_args_var", ""),
+        ("spec_type_enabled", "spec_type_enabled_var", False),
+        ("spec_type", "spec_type_var", "draft-mtp"),
+        ("spec_draft_n_max_enabled", "spec_draft_n_max_enabled_var", False),
+        ("spec_draft_n_max", "spec_draft_n_max_var", "2"),
+        ("run_in_terminal", "run_in_terminal_var", True),
+    )
+
+    # Parameter tab layout: (group title, ((label, variable attribute, hint), ...))
+    COMMON_PARAM_GROUPS = (
+        ("Network Settings", (
+            ("Host (--host):", "host_var", "IP address to bind (0.0.0.0 for all)"),
+            ("Port (--port):", "port_var", "Port number (default: 8033)"),
+        )),
+        ("Performance Settings", (
+            ("GPU Layers (-ngl):", "ngl_var", "Number of layers to offload to GPU (99 = all)"),
+            ("MoE Experts (-ncmoe):", "ncmoe_var", "Number of MoE experts to use (leave empty for default)"),
+            ("Threads (--threads):", "threads_var", "Number of threads (-1 = auto)"),
+            ("Context Size (--ctx-size):", "ctx_size_var", "Context window size in tokens"),
+        )),
+        ("Sampling Settings", (
+            ("Temperature (--temp):", "temp_var", "Sampling temperature (0.0-2.0)"),
+            ("Min P (--min-p):", "min_p_var", "Minimum probability threshold (0.0-1.0)"),
+            ("Top P (--top-p):", "top_p_var", "Top-p sampling probability (0.0-1.0)"),
+            ("Top K (--top-k):", "top_k_var", "Top-k filtering (0 = disabled)"),
+            ("Presence Penalty:", "presence_penalty_var", "Presence penalty (-2.0 to 2.0)"),
+            ("Repeat Penalty:", "repeat_penalty_var", "Repeat penalty (1.0 = disabled)"),
+        )),
+    )
+    ADDITIONAL_PARAM_GROUPS = (
+        ("Batch Settings", (
+            ("Batch Size (-b):", "batch_size_var", "Logical batch size (leave empty for default)"),
+            ("Micro Batch (-ub):", "ubatch_size_var", "Physical batch size (leave empty for default)"),
+            ("Parallel Slots (--parallel):", "parallel_var", "Number of parallel sequences"),
+        )),
+        ("Generation Settings", (
+            ("Max Predict (-n):", "n_predict_var", "Max tokens to predict (-1 = infinite)"),
+            ("Frequency Penalty:", "frequency_penalty_var", "Frequency penalty (0.0-2.0)"),
+        )),
+        ("RoPE Settings", (
+            ("RoPE Freq Base:", "rope_freq_base_var", "RoPE frequency base (leave empty for default)"),
+            ("RoPE Freq Scale:", "rope_freq_scale_var", "RoPE frequency scale (leave empty for default)"),
+        )),
+    )
+    # Checkbox groups: (checkbox text, variable attribute)
+    COMMON_FLAGS = (
+        ("Enable Jinja templates (--jinja)", "jinja_var"),
+    )
+    ADDITIONAL_FLAGS = (
+        ("Flash Attention (-fa)", "flash_attn_var"),
+        ("Lock memory (--mlock)", "mlock_var"),
+        ("Disable mmap (--no-mmap)", "no_mmap_var"),
+        ("Continuous batching (-cb)", "cont_batching_var"),
+        ("Enable metrics (--metrics)", "metrics_var"),
+        ("Verbose output (--verbose)", "verbose_var"),
+        ("Disable logging (--log-disable)", "log_disable_var"),
+        ("No MMProj Offload (--no-mmproj-offload)", "no_mmproj_offload_var"),
+        ("No MMProj (--no-mmproj)", "no_mmproj_var"),
+        ("CPU MoE (--cpu-moe)", "cpu_moe_var"),
+    )
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Llama Server Launcher")
@@ -80,9 +373,26 @@ class LlamaServerLauncher:
 
         # Process handle for background server
         self.server_process: Optional[subprocess.Popen] = None
+        # Server that has been sent SIGTERM and is being polled until it exits
+        self._stopping_process: Optional[subprocess.Popen] = None
+
+        # API info dialog, built on first use and then hidden/reshown rather than recreated
+        self._api_info_window: Optional[tk.Toplevel] = None
+        self._api_info_text: Optional[tk.Text] = None
+        self._api_base_url = ""
+
+        # First available terminal emulator, resolved once up front
+        self._terminal_cmd: Optional[list[str]] = self._find_terminal()
+
+        # Pending after() id for draining background server output into the log
+        self._output_poll_id: Optional[str] = None
 
         # Load configuration
         self.config = self.load_config()
+        # Pending after() id for a debounced config save
+        self._save_after_id: Optional[str] = None
+        # Serialized config from the last successful write, used to skip no-op saves
+        self._last_saved_config: Optional[bytes] = None
 
         # Initialize variables
         self.init_variables()
@@ -90,8 +400,8 @@ class LlamaServerLauncher:
         # Build UI
         self.build_ui()
 
-        # Load last used directory and settings
-        self.load_last_session()
+        # Load last used directory and settings once the window has painted
+        self.root.after_idle(self.load_last_session)
 
         # Bind cleanup on close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -99,33 +409,33 @@ class LlamaServerLauncher:
     def init_variables(self):
         """Initialize all Tkinter variables."""
         # Path variables
-        self.llama_server_path_var = tk.StringVar(value=self.config.get("llama_server_path", DEFAULT_LLAMA_SERVER_PATH))
-        self.gguf_dir_var = tk.StringVar(value=self.config.get("last_gguf_dir", ""))
-        self.selected_gguf_var = tk.StringVar()
+        self.llama_server_path_var = SafeStringVar(value=self.config.get("llama_server_path", DEFAULT_LLAMA_SERVER_PATH))
+        self.gguf_dir_var = SafeStringVar(value=self.config.get("last_gguf_dir", ""))
+        self.selected_gguf_var = SafeStringVar()
 
         # Common parameters (using StringVar for safe handling)
-        self.host_var = tk.StringVar(value="0.0.0.0")
-        self.port_var = tk.StringVar(value="8033")
-        self.ngl_var = tk.StringVar(value="99")
-        self.ncmoe_var = tk.StringVar(value="")
+        self.host_var = SafeStringVar(value="0.0.0.0")
+        self.port_var = SafeStringVar(value="8033")
+        self.ngl_var = SafeStringVar(value="99")
+        self.ncmoe_var = SafeStringVar(value="")
         self.jinja_var = tk.BooleanVar(value=True)
-        self.threads_var = tk.StringVar(value="-1")
-        self.ctx_size_var = tk.StringVar(value="8192")
-        self.temp_var = tk.StringVar(value="0.7")
-        self.min_p_var = tk.StringVar(value="0.0")
-        self.top_p_var = tk.StringVar(value="0.9")
-        self.top_k_var = tk.StringVar(value="40")
-        self.presence_penalty_var = tk.StringVar(value="0.0")
+        self.threads_var = SafeStringVar(value="-1")
+        self.ctx_size_var = SafeStringVar(value="8192")
+        self.temp_var = SafeStringVar(value="0.7")
+        self.min_p_var = SafeStringVar(value="0.0")
+        self.top_p_var = SafeStringVar(value="0.9")
+        self.top_k_var = SafeStringVar(value="40")
+        self.presence_penalty_var = SafeStringVar(value="0.0")
 
         # Additional parameters
-        self.mmproj_path_var = tk.StringVar(value="")
-        self.batch_size_var = tk.StringVar(value="")
-        self.ubatch_size_var = tk.StringVar(value="")
-        self.n_predict_var = tk.StringVar(value="")
-        self.rope_freq_base_var = tk.StringVar(value="")
-        self.rope_freq_scale_var = tk.StringVar(value="")
-        self.repeat_penalty_var = tk.StringVar(value="")
-        self.frequency_penalty_var = tk.StringVar(value="")
+        self.mmproj_path_var = SafeStringVar(value="")
+        self.batch_size_var = SafeStringVar(value="")
+        self.ubatch_size_var = SafeStringVar(value="")
+        self.n_predict_var = SafeStringVar(value="")
+        self.rope_freq_base_var = SafeStringVar(value="")
+        self.rope_freq_scale_var = SafeStringVar(value="")
+        self.repeat_penalty_var = SafeStringVar(value="")
+        self.frequency_penalty_var = SafeStringVar(value="")
         self.flash_attn_var = tk.BooleanVar(value=False)
         self.mlock_var = tk.BooleanVar(value=False)
         self.no_mmap_var = tk.BooleanVar(value=False)
@@ -136,44 +446,68 @@ class LlamaServerLauncher:
         self.no_mmproj_offload_var = tk.BooleanVar(value=False)
         self.no_mmproj_var = tk.BooleanVar(value=False)
         self.cpu_moe_var = tk.BooleanVar(value=False)
-        self.parallel_var = tk.StringVar(value="")
+        self.parallel_var = SafeStringVar(value="")
         self.spec_type_enabled_var = tk.BooleanVar(value=False)
-        self.spec_type_var = tk.StringVar(value="draft-mtp")
+        self.spec_type_var = SafeStringVar(value="draft-mtp")
         self.spec_draft_n_max_enabled_var = tk.BooleanVar(value=False)
-        self.spec_draft_n_max_var = tk.StringVar(value="2")
-        self.custom_args_var = tk.StringVar(value="")
+        self.spec_draft_n_max_var = SafeStringVar(value="2")
+        self.custom_args_var = SafeStringVar(value="")
 
         # KV Cache settings
-        self.cache_type_k_var = tk.StringVar(value="")
-        self.cache_type_v_var = tk.StringVar(value="")
+        self.cache_type_k_var = SafeStringVar(value="")
+        self.cache_type_v_var = SafeStringVar(value="")
         self.cache_type_options = ["", "f32", "f16", "bf16", "q8_0", "q4_0", "q4_1", "iq4_nl", "q5_0", "q5_1"]
 
         # OpenAI-compatible API settings
-        self.api_key_var = tk.StringVar(value="")
-        self.model_alias_var = tk.StringVar(value="")
-        self.chat_template_var = tk.StringVar(value="")
-        self.chat_template_file_var = tk.StringVar(value="")
+        self.api_key_var = SafeStringVar(value="")
+        self.model_alias_var = SafeStringVar(value="")
+        self.chat_template_var = SafeStringVar(value="")
+        self.chat_template_file_var = SafeStringVar(value="")
 
         # Run mode
         self.run_in_terminal_var = tk.BooleanVar(value=True)
 
-        # Available GGUF files list
+        # Available GGUF files list, plus a parallel lowercased copy for searching
         self.gguf_files: list[str] = []
+        self._gguf_files_lower: list[str] = []
+        # Directory listings keyed by GGUF dir: (mtime_ns of every scanned directory, files)
+        self._listing_cache: Dict[str, tuple[Dict[str, int], list[str]]] = {}
+        self._listing_lock = threading.Lock()
+        # Incremented per refresh so results from superseded background scans are dropped
+        self._scan_generation = 0
 
         # Search filter for models
-        self.model_search_var = tk.StringVar()
+        self.model_search_var = SafeStringVar()
+        # Pending after() id for the debounced search filter
+        self._filter_after_id: Optional[str] = None
+        # Last query and the indices of its matches, so an extended query only
+        # re-checks prior matches
+        self._last_query = ""
+        self._last_filtered: list[int] = []
+        # Values last pushed to the model combobox
+        self._last_values: tuple[str, ...] = ()
 
         # Model analysis info
-        self.model_info_var = tk.StringVar(value="No model selected")
+        self.model_info_var = SafeStringVar(value="No model selected")
+        # Text last written to model_info_var, so unchanged updates can be skipped
+        self._last_model_info = "No model selected"
         self.analysis_thread: Optional[threading.Thread] = None
         self.current_analysis_path: Optional[str] = None
         self.last_analysis_result: Optional[Dict[str, Any]] = None
+        # Analysis results keyed by absolute path, validated against file size and mtime,
+        # in least- to most-recently-used order
+        self._meta_cache: "OrderedDict[str, Dict[str, Any]]" = self._load_meta_cache()
+        self._meta_cache_lock = threading.Lock()
+        self._meta_flush_timer: Optional[threading.Timer] = None
+        self._meta_flush_lock = threading.Lock()
+        # Stop flag for the background metadata prefetch of the current directory
+        self._prefetch_stop = threading.Event()
 
         # Favorites - dict of {model_path: {"note": "...", "added": "timestamp"}}
         self.favorites: Dict[str, Dict[str, str]] = self.config.get("favorites", {})
 
         # Note for current model
-        self.note_var = tk.StringVar()
+        self.note_var = SafeStringVar()
 
         # Presets - dict of {preset_name: {settings_dict}}
         self.presets: Dict[str, dict] = self.config.get("presets", {})
@@ -182,15 +516,49 @@ class LlamaServerLauncher:
         self.model_preset_map: Dict[str, str] = self.config.get("model_preset_map", {})
 
         # Current preset name entry
-        self.preset_name_var = tk.StringVar()
+        self.preset_name_var = SafeStringVar()
 
         # Active preset label for current model
-        self.active_preset_var = tk.StringVar(value="No preset active")
+        self.active_preset_var = SafeStringVar(value="No preset active")
 
         # Clipboard for copy/paste preset between models
         self.clipboard_settings: Optional[dict] = None
         self.clipboard_source: str = ""  # model name the settings were copied from
 
+        # Variables read by build_command, snapshotted together by _snapshot()
+        string_var_names = ["llama_server_path_var", "custom_args_var"]
+        string_var_names += [attr for _, attr, kind, _ in self.CMD_SPEC if kind in ("str", "gated")]
+        self._string_vars: Dict[str, SafeStringVar] = {name: getattr(self, name) for name in string_var_names}
+        bool_var_names = [extra if kind == "gated" else attr for _, attr, kind, extra in self.CMD_SPEC if kind != "str"]
+        self._bool_vars: Dict[str, tk.BooleanVar] = {name: getattr(self, name) for name in bool_var_names}
+
+        # Keep the command preview live: any change to a command input schedules a refresh
+        self._preview_after_id: Optional[str] = None
+        self._last_preview_args: Optional[tuple[str, ...]] = None
+        # Set while apply_settings writes variables in bulk, so they trigger one refresh instead of ~40
+        self._preview_suspended = False
+        # Last built command, reused until one of its inputs is written
+        self._cmd_cache: Optional[tuple[str, ...]] = None
+        self._cmd_dirty = True
+        for var in (*self._string_vars.values(), *self._bool_vars.values(), self.gguf_dir_var, self.selected_gguf_var):
+            var.trace_add("write", self._mark_command_dirty)
+            var.trace_add("write", self.schedule_preview_update)
+
+        # Plain-dict mirror of the persisted settings, kept current by write traces
+        self._settings_shadow: Dict[str, Any] = {}
+        for key, attr, _default in self.SETTINGS_SPEC:
+            var = getattr(self, attr)
+            read = var.get_str if isinstance(var, SafeStringVar) else var.get
+            self._settings_shadow[key] = read()
+            var.trace_add("write", lambda *_, k=key, r=read: self._settings_shadow.__setitem__(k, r()))
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Read all command-related variables at once into a plain dict (strings are stripped)."""
+        values: Dict[str, Any] = {name: var.get_str() for name, var in self._string_vars.items()}
+        for name, var in self._bool_vars.items():
+            values[name] = var.get()
+        return values
+
     def build_ui(self):
         """Build the main user interface."""
         # Outermost container
@@ -260,10 +628,11 @@ class LlamaServerLauncher:
         self.notebook.add(common_tab, text="Common Parameters")
         self.build_common_params_tab(common_tab)
 
-        # Additional parameters tab
-        additional_tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(additional_tab, text="Additional Parameters")
-        self.build_additional_params_tab(additional_tab)
+        # Additional parameters tab - built on first selection to speed up startup
+        self.additional_tab = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(self.additional_tab, text="Additional Parameters")
+        self._additional_built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Presets tab
         presets_tab = ttk.Frame(self.notebook, padding="10")
@@ -273,6 +642,15 @@ class LlamaServerLauncher:
         # Command preview section
         self.build_command_preview_section(main_frame)
 
+        # Background server output section
+        self.build_server_output_section(main_frame)
+
+    def _on_tab_changed(self, event=None):
+        """Build the Additional Parameters tab the first time it is selected."""
+        if not self._additional_built and self.notebook.select() == str(self.additional_tab):
+            self._additional_built = True
+            self.build_additional_params_tab(self.additional_tab)
+
     def build_top_bar(self, parent):
         """Build the fixed top bar with Run Mode, Control Buttons, and Status Indicator."""
         # Clean dark toolbar
@@ -411,71 +789,49 @@ class LlamaServerLauncher:
         self.note_entry.bind("<FocusOut>", self.save_note)
         ttk.Button(note_frame, text="Save Note", command=self.save_note).pack(side=tk.LEFT)
 
-    def build_common_params_tab(self, parent):
-        """Build the common parameters tab."""
-        # Create scrollable frame
+    def _make_scrollable(self, parent) -> ttk.Frame:
+        """Create a vertically scrollable canvas in parent and return the inner frame to fill."""
         canvas = tk.Canvas(parent, highlightthickness=0)
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Coalesce the burst of <Configure> events fired while the frame is filled
+        # into a single scrollregion update once Tk is idle
+        pending = False
 
-        # Network settings
-        network_frame = ttk.LabelFrame(scrollable_frame, text="Network Settings", padding="5")
-        network_frame.pack(fill=tk.X, pady=(0, 10))
+        def _update_scrollregion():
+            nonlocal pending
+            pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
 
-        self.create_param_row(network_frame, "Host (--host):", self.host_var, "IP address to bind (0.0.0.0 for all)", 0)
-        self.create_param_row(network_frame, "Port (--port):", self.port_var, "Port number (default: 8033)", 1)
-
-        # GPU/Performance settings
-        perf_frame = ttk.LabelFrame(scrollable_frame, text="Performance Settings", padding="5")
-        perf_frame.pack(fill=tk.X, pady=(0, 10))
+        def _on_frame_configure(event):
+            nonlocal pending
+            if not pending:
+                pending = True
+                canvas.after_idle(_update_scrollregion)
 
-        self.create_param_row(perf_frame, "GPU Layers (-ngl):", self.ngl_var, "Number of layers to offload to GPU (99 = all)", 0)
-        self.create_param_row(perf_frame, "MoE Experts (-ncmoe):", self.ncmoe_var, "Number of MoE experts to use (leave empty for default)", 1)
-        self.create_param_row(perf_frame, "Threads (--threads):", self.threads_var, "Number of threads (-1 = auto)", 2)
-        self.create_param_row(perf_frame, "Context Size (--ctx-size):", self.ctx_size_var, "Context window size in tokens", 3)
+        scrollable_frame.bind("<Configure>", _on_frame_configure)
 
-        # Sampling settings
-        sampling_frame = ttk.LabelFrame(scrollable_frame, text="Sampling Settings", padding="5")
-        sampling_frame.pack(fill=tk.X, pady=(0, 10))
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
 
-        self.create_param_row(sampling_frame, "Temperature (--temp):", self.temp_var, "Sampling temperature (0.0-2.0)", 0)
-        self.create_param_row(sampling_frame, "Min P (--min-p):", self.min_p_var, "Minimum probability threshold (0.0-1.0)", 1)
-        self.create_param_row(sampling_frame, "Top P (--top-p):", self.top_p_var, "Top-p sampling probability (0.0-1.0)", 2)
-        self.create_param_row(sampling_frame, "Top K (--top-k):", self.top_k_var, "Top-k filtering (0 = disabled)", 3)
-        self.create_param_row(sampling_frame, "Presence Penalty:", self.presence_penalty_var, "Presence penalty (-2.0 to 2.0)", 4)
-        self.create_param_row(sampling_frame, "Repeat Penalty:", self.repeat_penalty_var, "Repeat penalty (1.0 = disabled)", 5)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Flags
-        flags_frame = ttk.LabelFrame(scrollable_frame, text="Flags", padding="5")
-        flags_frame.pack(fill=tk.X, pady=(0, 10))
+        return scrollable_frame
 
-        ttk.Checkbutton(flags_frame, text="Enable Jinja templates (--jinja)", variable=self.jinja_var).pack(anchor=tk.W)
+    def build_common_params_tab(self, parent):
+        """Build the common parameters tab."""
+        # Create scrollable frame
+        scrollable_frame = self._make_scrollable(parent)
 
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.build_param_groups(scrollable_frame, self.COMMON_PARAM_GROUPS)
+        self.build_flags_group(scrollable_frame, "Flags", self.COMMON_FLAGS)
 
     def build_additional_params_tab(self, parent):
         """Build the additional parameters tab."""
         # Create scrollable frame
-        canvas = tk.Canvas(parent, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self._make_scrollable(parent)
 
         # OpenAI-compatible API settings
         api_frame = ttk.LabelFrame(scrollable_frame, text="OpenAI-Compatible API Settings", padding="5")
@@ -486,12 +842,12 @@ class LlamaServerLauncher:
         self.create_param_row(api_frame, "Chat Template (--chat-template):", self.chat_template_var, "Jinja2 chat template (optional)", 2)
 
         template_file_row = ttk.Frame(api_frame)
-        template_file_row.pack(fill=tk.X, pady=2)
+        template_file_row.grid(row=3, column=0, columnspan=3, sticky="ew", pady=2)
         ttk.Label(template_file_row, text="Chat Template File:", width=25).pack(side=tk.LEFT)
         ttk.Entry(template_file_row, textvariable=self.chat_template_file_var, width=30).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
         ttk.Button(template_file_row, text="Browse...", command=self.browse_chat_template_file).pack(side=tk.LEFT)
 
-        ttk.Label(api_frame, text="Endpoints: /v1/chat/completions, /v1/completions, /v1/models, /v1/embeddings", foreground="gray").pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(api_frame, text="Endpoints: /v1/chat/completions, /v1/completions, /v1/models, /v1/embeddings", foreground="gray").grid(row=4, column=0, columnspan=3, sticky="w", pady=(5, 0))
 
         # Multimodal settings
         mm_frame = ttk.LabelFrame(scrollable_frame, text="Multimodal Settings", padding="5")
@@ -503,27 +859,8 @@ class LlamaServerLauncher:
         ttk.Entry(mmproj_row, textvariable=self.mmproj_path_var, width=40).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
         ttk.Button(mmproj_row, text="Browse...", command=self.browse_mmproj).pack(side=tk.LEFT)
 
-        # Batch settings
-        batch_frame = ttk.LabelFrame(scrollable_frame, text="Batch Settings", padding="5")
-        batch_frame.pack(fill=tk.X, pady=(0, 10))
-
-        self.create_param_row(batch_frame, "Batch Size (-b):", self.batch_size_var, "Logical batch size (leave empty for default)", 0)
-        self.create_param_row(batch_frame, "Micro Batch (-ub):", self.ubatch_size_var, "Physical batch size (leave empty for default)", 1)
-        self.create_param_row(batch_frame, "Parallel Slots (--parallel):", self.parallel_var, "Number of parallel sequences", 2)
-
-        # Generation settings
-        gen_frame = ttk.LabelFrame(scrollable_frame, text="Generation Settings", padding="5")
-        gen_frame.pack(fill=tk.X, pady=(0, 10))
-
-        self.create_param_row(gen_frame, "Max Predict (-n):", self.n_predict_var, "Max tokens to predict (-1 = infinite)", 0)
-        self.create_param_row(gen_frame, "Frequency Penalty:", self.frequency_penalty_var, "Frequency penalty (0.0-2.0)", 1)
-
-        # RoPE settings
-        rope_frame = ttk.LabelFrame(scrollable_frame, text="RoPE Settings", padding="5")
-        rope_frame.pack(fill=tk.X, pady=(0, 10))
-
-        self.create_param_row(rope_frame, "RoPE Freq Base:", self.rope_freq_base_var, "RoPE frequency base (leave empty for default)", 0)
-        self.create_param_row(rope_frame, "RoPE Freq Scale:", self.rope_freq_scale_var, "RoPE frequency scale (leave empty for default)", 1)
+        # Batch, generation and RoPE settings
+        self.build_param_groups(scrollable_frame, self.ADDITIONAL_PARAM_GROUPS)
 
         # Speculative decoding settings
         spec_frame = ttk.LabelFrame(scrollable_frame, text="Speculative Decoding", padding="5")
@@ -565,19 +902,7 @@ class LlamaServerLauncher:
         ttk.Label(cache_v_row, text="KV cache data type for V (empty = default)", foreground="gray").pack(side=tk.LEFT)
 
         # Additional flags
-        flags_frame = ttk.LabelFrame(scrollable_frame, text="Additional Flags", padding="5")
-        flags_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Checkbutton(flags_frame, text="Flash Attention (-fa)", variable=self.flash_attn_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Lock memory (--mlock)", variable=self.mlock_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Disable mmap (--no-mmap)", variable=self.no_mmap_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Continuous batching (-cb)", variable=self.cont_batching_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Enable metrics (--metrics)", variable=self.metrics_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Verbose output (--verbose)", variable=self.verbose_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="Disable logging (--log-disable)", variable=self.log_disable_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="No MMProj Offload (--no-mmproj-offload)", variable=self.no_mmproj_offload_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="No MMProj (--no-mmproj)", variable=self.no_mmproj_var).pack(anchor=tk.W)
-        ttk.Checkbutton(flags_frame, text="CPU MoE (--cpu-moe)", variable=self.cpu_moe_var).pack(anchor=tk.W)
+        self.build_flags_group(scrollable_frame, "Additional Flags", self.ADDITIONAL_FLAGS)
 
         # Custom arguments
         custom_frame = ttk.LabelFrame(scrollable_frame, text="Custom Arguments", padding="5")
@@ -586,21 +911,30 @@ class LlamaServerLauncher:
         ttk.Label(custom_frame, text="Additional arguments (space-separated):").pack(anchor=tk.W)
         ttk.Entry(custom_frame, textvariable=self.custom_args_var, width=60).pack(fill=tk.X, pady=(5, 0))
 
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    def build_param_groups(self, parent, groups):
+        """Build one LabelFrame of parameter rows per (title, rows) entry in groups."""
+        for title, rows in groups:
+            group_frame = ttk.LabelFrame(parent, text=title, padding="5")
+            group_frame.pack(fill=tk.X, pady=(0, 10))
+            for row, (label, attr, tooltip) in enumerate(rows):
+                self.create_param_row(group_frame, label, getattr(self, attr), tooltip, row)
+
+    def build_flags_group(self, parent, title: str, flags):
+        """Build a LabelFrame with one checkbox per (text, variable attribute) entry in flags."""
+        flags_frame = ttk.LabelFrame(parent, text=title, padding="5")
+        flags_frame.pack(fill=tk.X, pady=(0, 10))
+        for text, attr in flags:
+            ttk.Checkbutton(flags_frame, text=text, variable=getattr(self, attr)).pack(anchor=tk.W)
 
     def create_param_row(self, parent, label: str, var: tk.StringVar, tooltip: str, row: int):
-        """Create a parameter input row with label and entry."""
-        frame = ttk.Frame(parent)
-        frame.pack(fill=tk.X, pady=2)
-
-        lbl = ttk.Label(frame, text=label, width=25)
-        lbl.pack(side=tk.LEFT)
-
-        entry = ttk.Entry(frame, textvariable=var, width=15)
-        entry.pack(side=tk.LEFT, padx=(5, 10))
+        """Create a parameter input row with label and entry, gridded directly into parent."""
+        if row == 0:
+            # Let the tooltip column take the spare width so rows stay left-aligned
+            parent.columnconfigure(2, weight=1)
 
-        ttk.Label(frame, text=tooltip, foreground="gray").pack(side=tk.LEFT)
+        ttk.Label(parent, text=label, width=25).grid(row=row, column=0, sticky="w", pady=2)
+        ttk.Entry(parent, textvariable=var, width=15).grid(row=row, column=1, sticky="w", padx=(5, 10), pady=2)
+        ttk.Label(parent, text=tooltip, foreground="gray").grid(row=row, column=2, sticky="w", pady=2)
 
     def build_presets_tab(self, parent):
         """Build the presets management tab."""
@@ -688,7 +1022,7 @@ class LlamaServerLauncher:
 
     def save_preset(self):
         """Save the current parameter configuration as a named preset."""
-        name = SafeVar.get_str(self.preset_name_var)
+        name = self.preset_name_var.get_str()
         if not name:
             messagebox.showwarning("Preset Name Required", "Please type a preset name before saving.")
             return
@@ -716,7 +1050,7 @@ class LlamaServerLauncher:
 
     def load_preset(self):
         """Load a named preset and apply its settings."""
-        name = SafeVar.get_str(self.preset_name_var)
+        name = self.preset_name_var.get_str()
         if not name:
             messagebox.showwarning("Preset Name Required", "Please type or select a preset name to load.")
             return
@@ -739,12 +1073,12 @@ class LlamaServerLauncher:
             self.config["model_settings"][model_path] = self.presets[name].copy()
             self.save_config()
 
-        self.update_command_preview()
+        self.schedule_preview_update()
         self.status_var.set(f"Preset '{name}' loaded")
 
     def delete_preset(self):
         """Delete a named preset."""
-        name = SafeVar.get_str(self.preset_name_var)
+        name = self.preset_name_var.get_str()
         if not name:
             messagebox.showwarning("Preset Name Required", "Please type or select a preset name to delete.")
             return
@@ -825,7 +1159,7 @@ class LlamaServerLauncher:
             return
 
         # Preserve the current model's alias before pasting
-        current_alias = SafeVar.get_str(self.model_alias_var)
+        current_alias = self.model_alias_var.get_str()
 
         self.apply_settings(self.clipboard_settings)
 
@@ -840,7 +1174,7 @@ class LlamaServerLauncher:
         self.config["model_settings"][model_path] = saved
         self.save_config()
 
-        self.update_command_preview()
+        self.schedule_preview_update()
         self.status_var.set(f"Settings pasted from {self.clipboard_source} → {target_name}")
 
     def build_command_preview_section(self, parent):
@@ -866,39 +1200,127 @@ class LlamaServerLauncher:
         ttk.Button(btn_frame, text="Update Preview", command=self.update_command_preview).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(btn_frame, text="Copy Command", command=self.copy_command).pack(side=tk.LEFT)
 
+    def build_server_output_section(self, parent):
+        """Build the section showing output from a server run in the background."""
+        frame = ttk.LabelFrame(parent, text="Server Output (Background Mode)", padding="5")
+        frame.pack(fill=tk.X, pady=(10, 0))
+
+        text_frame = ttk.Frame(frame)
+        text_frame.pack(fill=tk.X)
+
+        self.server_log_text = tk.Text(text_frame, height=8, wrap=tk.NONE, font=("Courier", 9), state="disabled")
+        self.server_log_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.server_log_text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.server_log_text.configure(yscrollcommand=scrollbar.set)
+
+    def _read_server_output(self, process: subprocess.Popen, output_queue: "queue.Queue[Optional[bytes]]", log_file):
+        """
+        Reader thread: forward raw output chunks from the server into the queue until EOF,
+        then put None to mark the end of output. Every chunk is also appended to log_file
+        (if given), which keeps the full output beyond the 1000 lines shown in the log panel.
+        """
+        fd = process.stdout.fileno()
+        try:
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                output_queue.put(chunk)
+                if log_file is not None:
+                    try:
+                        log_file.write(chunk)
+                    except OSError as e:
+                        # A full or failing disk must not stop the drain - the server
+                        # would die on its next write to a closed pipe
+                        try:
+                            log_file.close()
+                        except OSError:
+                            pass
+                        log_file = None
+                        self._post_status(f"Server log file disabled: {e}")
+        except OSError:
+            pass
+        finally:
+            process.stdout.close()
+            if log_file is not None:
+                log_file.close()
+            output_queue.put(None)
+
+    def _drain_server_output(self, process: subprocess.Popen, output_queue: "queue.Queue[Optional[bytes]]", decoder):
+        """Append queued server output to the log widget, polling until the reader thread is done."""
+        self._output_poll_id = None
+        chunks = []
+        finished = False
+        try:
+            while True:
+                chunk = output_queue.get_nowait()
+                if chunk is None:
+                    # Reader hit EOF - nothing more will arrive
+                    finished = True
+                    break
+                chunks.append(chunk)
+        except queue.Empty:
+            pass
+
+        # Flush any partial UTF-8 sequence left at the very end of the output
+        text = decoder.decode(b"".join(chunks), final=finished)
+        if text:
+            self.server_log_text.configure(state="normal")
+            self.server_log_text.insert(tk.END, text)
+            # Keep only the most recent 1000 lines
+            line_count = int(self.server_log_text.index("end-1c").split(".")[0])
+            if line_count > 1000:
+                self.server_log_text.delete("1.0", f"{line_count - 1000}.0")
+            self.server_log_text.configure(state="disabled")
+            self.server_log_text.see(tk.END)
+
+        if not finished:
+            self._output_poll_id = self.root.after(100, self._drain_server_output, process, output_queue, decoder)
+
     def browse_llama_server(self):
         """Browse for llama-server executable."""
+        # Imported on first use - only needed once the user opens a file dialog
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select llama-server executable",
-            initialdir=os.path.dirname(SafeVar.get_str(self.llama_server_path_var)) or os.path.expanduser("~")
+            initialdir=os.path.dirname(self.llama_server_path_var.get_str()) or os.path.expanduser("~")
         )
         if path:
             self.llama_server_path_var.set(path)
-            self.save_config()
+            self._schedule_save()
 
     def browse_gguf_dir(self):
         """Browse for GGUF files directory."""
+        from tkinter import filedialog
+
         path = filedialog.askdirectory(
             title="Select GGUF Files Directory",
-            initialdir=SafeVar.get_str(self.gguf_dir_var) or os.path.expanduser("~")
+            initialdir=self.gguf_dir_var.get_str() or os.path.expanduser("~")
         )
         if path:
             self.gguf_dir_var.set(path)
             self.refresh_gguf_list()
-            self.save_config()
+            self._schedule_save()
 
     def browse_mmproj(self):
         """Browse for mmproj file."""
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select MMProj File",
             filetypes=[("GGUF files", "*.gguf"), ("All files", "*.*")],
-            initialdir=SafeVar.get_str(self.gguf_dir_var) or os.path.expanduser("~")
+            initialdir=self.gguf_dir_var.get_str() or os.path.expanduser("~")
         )
         if path:
             self.mmproj_path_var.set(path)
 
     def browse_chat_template_file(self):
         """Browse for chat template file."""
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select Chat Template File",
             filetypes=[("Jinja2 templates", "*.jinja *.jinja2 *.j2"), ("Text files", "*.txt"), ("All files", "*.*")],
@@ -907,50 +1329,178 @@ class LlamaServerLauncher:
         if path:
             self.chat_template_file_var.set(path)
 
-    def refresh_gguf_list(self):
-        """Refresh the list of GGUF files in the selected directory and subdirectories."""
-        gguf_dir = SafeVar.get_str(self.gguf_dir_var)
+    def refresh_gguf_list(self, on_complete: Optional[Callable[[], None]] = None):
+        """
+        Refresh the list of GGUF files in the selected directory and subdirectories.
+        The directory scan runs in a worker thread; on_complete is called on the
+        main thread once the new list has been applied.
+        """
+        self._scan_generation += 1
+        generation = self._scan_generation
+        # The listing is about to change - stop warming metadata for the old one
+        self._prefetch_stop.set()
+
+        gguf_dir = self.gguf_dir_var.get_str()
         if not gguf_dir or not os.path.isdir(gguf_dir):
-            self.gguf_files = []
-            self.gguf_combo["values"] = []
+            self._finish_refresh(generation, gguf_dir, [], on_complete)
             return
 
-        # Recursively find all .gguf files in directory and subdirectories
-        # followlinks=True to include symbolic link directories
-        gguf_files = []
-        for root, dirs, files in os.walk(gguf_dir, followlinks=True):
-            for f in files:
-                if f.lower().endswith(".gguf"):
-                    # Store relative path from gguf_dir
-                    full_path = os.path.join(root, f)
-                    rel_path = os.path.relpath(full_path, gguf_dir)
-                    gguf_files.append(rel_path)
+        self.status_var.set("Scanning for GGUF files...")
 
-        self.gguf_files = sorted(gguf_files)
+        def scan_worker():
+            files = self._get_gguf_listing(gguf_dir)
+            # Schedule UI update on main thread
+            self.root.after(0, lambda: self._finish_refresh(generation, gguf_dir, files, on_complete))
 
-        # Apply current filter
-        self.filter_gguf_list()
+        threading.Thread(target=scan_worker, daemon=True).start()
+
+    def _finish_refresh(self, generation: int, gguf_dir: str, files: list[str],
+                        on_complete: Optional[Callable[[], None]] = None):
+        """Apply a completed scan of gguf_dir to the model list (main thread only)."""
+        if generation != self._scan_generation:
+            # A newer refresh has started since this scan began
+            return
 
-        if self.gguf_files:
+        self.gguf_files = files
+        self._gguf_files_lower = [f.lower() for f in self.gguf_files]
+        # The file list changed, so previous matches can no longer be refined
+        self._last_query = ""
+        self._last_filtered = list(range(len(self.gguf_files)))
+
+        # Apply current filter immediately (on_complete reads the combo values right after)
+        self._apply_filter()
+
+        if len(self.gguf_files) > MAX_COMBO_ITEMS:
+            self.status_var.set(f"Found {len(self.gguf_files)} GGUF file(s) - showing first {MAX_COMBO_ITEMS}, use Search to narrow")
+        elif self.gguf_files:
             self.status_var.set(f"Found {len(self.gguf_files)} GGUF file(s)")
-        else:
+        elif gguf_dir:
             self.status_var.set("No GGUF files found in directory")
 
+        if on_complete is not None:
+            on_complete()
+
+        # Skip the prefetch when the listing would not fit in the LRU cache: a full pass
+        # would evict its own entries and the models the user actually opened
+        if self.gguf_files and len(self.gguf_files) <= META_CACHE_MAX_ENTRIES:
+            self._prefetch_stop = threading.Event()
+            threading.Thread(
+                target=self._prefetch_metadata,
+                args=(gguf_dir, list(self.gguf_files), self._prefetch_stop),
+                daemon=True
+            ).start()
+
+    def _prefetch_metadata(self, gguf_dir: str, files: list[str], stop: threading.Event):
+        """
+        Worker thread: warm the metadata cache for every model in the listing so that
+        selecting one shows its info immediately. Stops as soon as stop is set.
+        """
+        for rel_path in files:
+            if stop.is_set():
+                return
+            # Cache hits return straight away; llama-cpp is skipped here, it is too heavy to run in bulk
+            self._run_gguf_analysis(os.path.join(gguf_dir, rel_path), use_llama_cpp=False)
+
+    def _get_gguf_listing(self, gguf_dir: str) -> list[str]:
+        """
+        Return the sorted GGUF listing for a directory, reusing the cached listing
+        while none of the scanned directories have been modified since.
+        """
+        with self._listing_lock:
+            cached = self._listing_cache.get(gguf_dir)
+        if cached is not None:
+            dir_mtimes, files = cached
+            try:
+                if all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items()):
+                    return files
+            except OSError:
+                pass
+
+        gguf_files, dir_mtimes = self._scan_gguf_dir(gguf_dir)
+        files = sorted(gguf_files)
+
+        # Keep the cache small - drop the oldest directory once it grows past 8
+        with self._listing_lock:
+            self._listing_cache.pop(gguf_dir, None)
+            self._listing_cache[gguf_dir] = (dir_mtimes, files)
+            if len(self._listing_cache) > 8:
+                del self._listing_cache[next(iter(self._listing_cache))]
+
+        return files
+
+    def _scan_gguf_dir(self, gguf_dir: str) -> tuple[list[str], Dict[str, int]]:
+        """
+        Recursively find all .gguf files in a directory and its subdirectories.
+        Symbolic link directories are followed. Returns paths relative to gguf_dir,
+        plus the mtime of every directory scanned so the listing can be validated later.
+        """
+        gguf_files = []
+        dir_mtimes: Dict[str, int] = {}
+        # Stack of (directory path, relative prefix) pairs still to scan
+        pending = [(gguf_dir, "")]
+        while pending:
+            dir_path, prefix = pending.pop()
+            try:
+                # Record the mtime before listing so changes made mid-scan invalidate it
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        try:
+                            if entry.is_dir():
+                                pending.append((entry.path, prefix + name + os.sep))
+                            elif name[-5:].lower() == ".gguf" and entry.is_file():
+                                gguf_files.append(prefix + name)
+                        except OSError:
+                            continue
+            except OSError:
+                # Unreadable directory - skip it like os.walk does
+                continue
+        return gguf_files, dir_mtimes
+
     def filter_gguf_list(self, *args):
+        """Schedule a filter pass, collapsing bursts of keystrokes into one update."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, self._apply_filter)
+
+    def _apply_filter(self):
         """Filter the GGUF files list based on search text and show favorites first."""
-        search_text = SafeVar.get_str(self.model_search_var).lower()
-        gguf_dir = SafeVar.get_str(self.gguf_dir_var)
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+        search_text = self.model_search_var.get_str().lower()
+        gguf_dir = self.gguf_dir_var.get_str()
 
         if not search_text:
             # No filter, show all files
-            filtered = self.gguf_files.copy()
+            match_indices = list(range(len(self.gguf_files)))
         else:
-            # Filter files containing all search terms (space-separated)
-            search_terms = search_text.split()
-            filtered = [
-                f for f in self.gguf_files
-                if all(term in f.lower() for term in search_terms)
-            ]
+            # Appending to the previous query can only narrow its result set,
+            # so only the previous matches need to be checked again
+            if self._last_query and search_text.startswith(self._last_query):
+                candidates = self._last_filtered
+            else:
+                candidates = range(len(self.gguf_files))
+
+            # Filter files containing all search terms (space-separated),
+            # matching against the precomputed lowercase names. The longest
+            # (most selective) term is tested first so misses bail out early.
+            search_terms = sorted(search_text.split(), key=len, reverse=True)
+            files_lower = self._gguf_files_lower
+            match_indices = []
+            for i in candidates:
+                name = files_lower[i]
+                for term in search_terms:
+                    if term not in name:
+                        break
+                else:
+                    match_indices.append(i)
+
+        self._last_query = search_text
+        self._last_filtered = match_indices
+        matches = [self.gguf_files[i] for i in match_indices]
 
         # Sort: favorites first, then alphabetically
         def sort_key(filename):
@@ -958,7 +1508,12 @@ class LlamaServerLauncher:
             is_favorite = full_path in self.favorites
             return (0 if is_favorite else 1, filename.lower())
 
-        filtered.sort(key=sort_key)
+        filtered = sorted(matches, key=sort_key)
+
+        # Cap the dropdown size so huge directories don't balloon the combobox
+        truncated = len(filtered) > MAX_COMBO_ITEMS
+        if truncated:
+            filtered = filtered[:MAX_COMBO_ITEMS]
 
         # Add star marker to favorites in display
         display_list = []
@@ -969,18 +1524,25 @@ class LlamaServerLauncher:
             else:
                 display_list.append(f)
 
-        self.gguf_combo["values"] = display_list
+        # Only push the list to the combobox when it actually changed
+        values = tuple(display_list)
+        if values != self._last_values:
+            self.gguf_combo["values"] = values
+            self._last_values = values
 
         # Update status
-        if search_text and self.gguf_files:
+        if truncated:
+            self.status_var.set(f"Showing {MAX_COMBO_ITEMS} of {len(matches)} matching model(s) - refine search")
+        elif search_text and self.gguf_files:
             self.status_var.set(f"Showing {len(filtered)} of {len(self.gguf_files)} model(s)")
 
-    def _run_gguf_analysis(self, model_path: str) -> Dict[str, Any]:
+    def _run_gguf_analysis(self, model_path: str, use_llama_cpp: bool = True) -> Dict[str, Any]:
         """
         Analyze a GGUF model file to extract metadata.
         Runs in a worker thread to avoid blocking the UI.
 
-        Uses gguf library for direct file reading (preferred) or falls back to llama-cpp-python.
+        Parses the GGUF header directly first, then tries the gguf library and finally
+        llama-cpp-python unless use_llama_cpp is False.
         Returns a dictionary with model information or an error key.
         """
         result = {
@@ -989,24 +1551,42 @@ class LlamaServerLauncher:
         }
 
         try:
+            st = os.stat(model_path)
+            cached = self._lookup_meta_cache(model_path, st)
+            if cached is not None:
+                return cached
+
             # Get file size
-            file_size_bytes = os.path.getsize(model_path)
+            file_size_bytes = st.st_size
             result["file_size_bytes"] = file_size_bytes
             result["file_size_gb"] = round(file_size_bytes / (1024 ** 3), 2)
 
-            # Try gguf library first (most reliable - reads file directly)
-            if GGUF_READER_AVAILABLE:
+            # Parse the metadata header directly first: needs no libraries and stops
+            # reading as soon as the fields shown in the info line have been seen
+            try:
+                parsed = self._analyze_with_header_parser(model_path, dict(result))
+            except Exception:
+                # Fall through to the gguf library
+                pass
+            else:
+                self._store_meta_cache(model_path, st, parsed)
+                return parsed
+
+            # Try gguf library next (most reliable - reads file directly)
+            if _ensure_gguf_reader():
                 try:
                     result = self._analyze_with_gguf_reader(model_path, result)
+                    self._store_meta_cache(model_path, st, result)
                     return result
                 except Exception as e:
                     # Fall through to try llama-cpp-python
                     pass
 
             # Try llama-cpp-python as fallback
-            if LLAMA_CPP_AVAILABLE:
+            if use_llama_cpp and _ensure_llama_cpp():
                 try:
                     result = self._analyze_with_llama_cpp(model_path, result)
+                    self._store_meta_cache(model_path, st, result)
                     return result
                 except Exception as e:
                     result["warning"] = f"Metadata extraction failed: {str(e)}"
@@ -1025,63 +1605,222 @@ class LlamaServerLauncher:
 
         return result
 
+    def _load_meta_cache(self) -> "OrderedDict[str, Dict[str, Any]]":
+        """Load the on-disk metadata cache, discarding it if it was written by another schema version."""
+        try:
+            if MSGPACK_AVAILABLE and os.path.exists(META_CACHE_PACK_FILE):
+                cache = msgpack.unpackb(Path(META_CACHE_PACK_FILE).read_bytes(), raw=False)
+            elif os.path.exists(META_CACHE_FILE):
+                data = Path(META_CACHE_FILE).read_bytes()
+                cache = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            else:
+                return OrderedDict()
+            if cache.get("schema_version") == META_CACHE_VERSION:
+                # Entries are stored oldest first; keep only the newest if the limit was lowered
+                entries = list(cache.get("entries", {}).items())
+                return OrderedDict(entries[-META_CACHE_MAX_ENTRIES:])
+        except Exception as e:
+            print(f"Error loading metadata cache: {e}")
+        return OrderedDict()
+
+    def _lookup_meta_cache(self, model_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return a cached analysis result if the file is unchanged since it was analyzed."""
+        key = os.path.abspath(model_path)
+        with self._meta_cache_lock:
+            entry = self._meta_cache.get(key)
+            if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+                self._meta_cache.move_to_end(key)
+                return dict(entry["result"])
+        return None
+
+    def _store_meta_cache(self, model_path: str, st: os.stat_result, result: Dict[str, Any]):
+        """Record an analysis result and schedule a cache write 2 s from now (any thread)."""
+        key = os.path.abspath(model_path)
+        with self._meta_cache_lock:
+            self._meta_cache[key] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "result": dict(result),
+            }
+            self._meta_cache.move_to_end(key)
+            # Evict the least recently used entries
+            while len(self._meta_cache) > META_CACHE_MAX_ENTRIES:
+                self._meta_cache.popitem(last=False)
+            if self._meta_flush_timer is None:
+                self._meta_flush_timer = threading.Timer(2.0, self._flush_meta_cache)
+                self._meta_flush_timer.daemon = True
+                self._meta_flush_timer.start()
+
+    def _flush_meta_cache(self):
+        """
+        Write the metadata cache to disk as msgpack when available, else JSON (tmp file + os.replace).
+        Entries for models that no longer exist are dropped first.
+        """
+        # Held for the whole flush so a timer flush and on_close never write at the same time
+        with self._meta_flush_lock:
+            with self._meta_cache_lock:
+                if self._meta_flush_timer is not None:
+                    self._meta_flush_timer.cancel()
+                    self._meta_flush_timer = None
+                paths = list(self._meta_cache)
+            # Check outside the lock so analysis threads aren't held up by the stat calls
+            missing = [path for path in paths if not os.path.exists(path)]
+            with self._meta_cache_lock:
+                for path in missing:
+                    self._meta_cache.pop(path, None)
+                cache = {"schema_version": META_CACHE_VERSION, "entries": self._meta_cache}
+                # Metadata values may be numpy scalars, so fall back to str for anything that can't be encoded
+                if MSGPACK_AVAILABLE:
+                    path = META_CACHE_PACK_FILE
+                    data = msgpack.packb(cache, use_bin_type=True, default=str)
+                else:
+                    path = META_CACHE_FILE
+                    data = json.dumps(cache, default=str).encode("utf-8")
+            try:
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                if path == META_CACHE_PACK_FILE:
+                    # The JSON copy is superseded once msgpack is in use - don't leave it behind
+                    try:
+                        os.remove(META_CACHE_FILE)
+                    except FileNotFoundError:
+                        pass
+            except Exception as e:
+                print(f"Error saving metadata cache: {e}")
+
     def _analyze_with_gguf_reader(self, model_path: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze GGUF using the gguf library (reads file directly without loading model).
         This is the most reliable method.
         """
-        reader = GGUFReader(model_path)
+        import numpy as np  # Always present alongside gguf, which depends on it
 
-        # Helper function to extract field value
-        def get_field_value(field_name: str, default=None):
-            """Extract a single value from a GGUF field."""
-            if field_name not in reader.fields:
-                return default
-            field = reader.fields[field_name]
-            try:
-                # Get the data parts
-                if hasattr(field, 'parts') and field.parts:
-                    data = field.parts[-1]
-                    if hasattr(data, 'tolist'):
-                        val = data.tolist()
-                        if isinstance(val, list):
-                            if len(val) == 0:
-                                return default
-                            # Single element array - return the value directly
-                            if len(val) == 1:
-                                return val[0]
-                            # Multi-element array - check if it's an ASCII string
-                            # ASCII strings are typically longer and contain printable chars
-                            try:
-                                int_vals = [int(x) for x in val]
-                                # If all values are valid ASCII printable range or common control chars
-                                if all(0 <= x < 256 for x in int_vals):
-                                    decoded = bytes(int_vals).decode('utf-8', errors='ignore')
-                                    # Return as string if it looks like text (has letters)
-                                    if any(c.isalpha() for c in decoded):
-                                        return decoded
-                            except (ValueError, TypeError, OverflowError):
-                                pass
-                            # Otherwise return the list as-is
+        reader = GGUFReader(os.fspath(model_path), 'r')
+        try:
+            # Helper function to extract field value
+            def get_field_value(field_name: str, default=None):
+                """Extract a single value from a GGUF field."""
+                if field_name not in reader.fields:
+                    return default
+                field = reader.fields[field_name]
+                try:
+                    # Get the data parts
+                    if hasattr(field, 'parts') and field.parts:
+                        data = field.parts[-1]
+                        # Declared string scalar: the last part holds the UTF-8 bytes, no guessing needed
+                        if getattr(field, 'types', None) == [GGUFValueType.STRING]:
+                            return bytes(data).decode('utf-8', errors='ignore')
+                        if isinstance(data, np.ndarray) and data.size > 1 and data.dtype.kind in "iu":
+                            # Integer array - decode as text using whole-array operations instead
+                            # of converting element by element (same rules as the generic path below)
+                            if data.dtype == np.uint8:
+                                raw = data.tobytes()
+                            elif ((data >= 0) & (data < 256)).all():
+                                raw = data.astype(np.uint8).tobytes()
+                            else:
+                                raw = None
+                            if raw is not None:
+                                decoded = raw.decode('utf-8', errors='ignore')
+                                if _has_letter(raw, decoded):
+                                    return decoded
+                            return data.tolist()
+                        if hasattr(data, 'tolist'):
+                            val = data.tolist()
+                            if isinstance(val, list):
+                                if len(val) == 0:
+                                    return default
+                                # Single element array - return the value directly
+                                if len(val) == 1:
+                                    return val[0]
+                                # Multi-element array - check if it's an ASCII string
+                                # ASCII strings are typically longer and contain printable chars
+                                try:
+                                    int_vals = [int(x) for x in val]
+                                    # If all values are valid ASCII printable range or common control chars
+                                    if all(0 <= x < 256 for x in int_vals):
+                                        raw = bytes(int_vals)
+                                        decoded = raw.decode('utf-8', errors='ignore')
+                                        # Return as string if it looks like text (has letters)
+                                        if _has_letter(raw, decoded):
+                                            return decoded
+                                except (ValueError, TypeError, OverflowError):
+                                    pass
+                                # Otherwise return the list as-is
+                                return val
+                            # Decode bytes to string
+                            if isinstance(val, bytes):
+                                return val.decode('utf-8', errors='ignore')
                             return val
-                        # Decode bytes to string
-                        if isinstance(val, bytes):
-                            return val.decode('utf-8', errors='ignore')
-                        return val
-                    elif isinstance(data, bytes):
-                        return data.decode('utf-8', errors='ignore')
-                    else:
+                        elif isinstance(data, bytes):
+                            return data.decode('utf-8', errors='ignore')
+                        else:
+                            return data
+                    # Alternative: try data attribute
+                    elif hasattr(field, 'data'):
+                        data = field.data
+                        if isinstance(data, bytes):
+                            return data.decode('utf-8', errors='ignore')
                         return data
-                # Alternative: try data attribute
-                elif hasattr(field, 'data'):
-                    data = field.data
-                    if isinstance(data, bytes):
-                        return data.decode('utf-8', errors='ignore')
-                    return data
-            except Exception:
-                pass
-            return default
+                except Exception:
+                    pass
+                return default
 
+            return self._fill_model_info(result, get_field_value, reader.fields)
+        finally:
+            # Drop the reader now so its memory map is released before the next file is
+            # opened (the prefetcher walks many files), then close the map outright if it
+            # is still open and nothing else references it
+            mm = getattr(getattr(reader, "data", None), "_mmap", None)
+            del reader
+            if mm is not None:
+                try:
+                    mm.close()
+                except (BufferError, ValueError):
+                    pass
+
+    def _analyze_with_header_parser(self, model_path: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze GGUF by walking its metadata header with struct (no gguf library needed).
+        Reading stops once every field the info line needs has been seen, which in
+        practice is before the large tokenizer arrays.
+        """
+        need_file_type = self._guess_quantization(result["filename"]) == "unknown"
+        fields: Dict[str, Any] = {}
+        wanted: Optional[set[str]] = None
+        entries = _iter_gguf_metadata(model_path)
+        try:
+            for key, value in entries:
+                if value is not None:
+                    fields[key] = value
+                if wanted is None:
+                    if key == "general.architecture":
+                        arch = value
+                        wanted = {
+                            "general.name",
+                            f"{arch}.context_length",
+                            f"{arch}.block_count",
+                            f"{arch}.embedding_length",
+                            f"{arch}.attention.head_count",
+                        }
+                        if need_file_type:
+                            wanted.add("general.file_type")
+                        wanted.difference_update(fields)
+                else:
+                    wanted.discard(key)
+                if wanted is not None and not wanted:
+                    break
+        finally:
+            entries.close()
+
+        return self._fill_model_info(result, fields.get, fields)
+
+    def _fill_model_info(self, result: Dict[str, Any], get_field_value: Callable[..., Any], field_names) -> Dict[str, Any]:
+        """
+        Fill the model info keys of result from GGUF metadata. get_field_value(name, default=None)
+        looks up a single field and field_names iterates over every field name in the file.
+        """
         # Architecture
         arch = get_field_value("general.architecture", "unknown")
         if isinstance(arch, bytes):
@@ -1098,49 +1837,40 @@ class LlamaServerLauncher:
         model_name = get_field_value("general.name", result["filename"])
         result["model_name"] = str(model_name) if model_name else result["filename"]
 
-        # Context length - try architecture-specific key first
+        # Exact keys first - direct lookups. Context length also has a general.* key.
         ctx_length = get_field_value(f"{arch}.context_length")
         if ctx_length is None:
             ctx_length = get_field_value("general.context_length")
-        # Search for any context_length key
-        if ctx_length is None:
-            for key in reader.fields.keys():
-                if 'context_length' in key:
-                    ctx_length = get_field_value(key)
-                    if ctx_length is not None:
-                        break
-        result["context_length"] = ctx_length if ctx_length is not None else "unknown"
-
-        # Layer count (block_count) - try architecture-specific key first
-        layer_count = get_field_value(f"{arch}.block_count")
-        if layer_count is None:
-            # Search for any block_count key
-            for key in reader.fields.keys():
-                if 'block_count' in key:
-                    layer_count = get_field_value(key)
-                    if layer_count is not None:
-                        break
-        result["layer_count"] = layer_count if layer_count is not None else "unknown"
-
-        # Embedding length - search for it
-        embed_length = get_field_value(f"{arch}.embedding_length")
-        if embed_length is None:
-            for key in reader.fields.keys():
-                if 'embedding_length' in key:
-                    embed_length = get_field_value(key)
-                    if embed_length is not None:
-                        break
-        result["embedding_length"] = embed_length if embed_length is not None else "unknown"
-
-        # Head count - search for it
-        head_count = get_field_value(f"{arch}.attention.head_count")
-        if head_count is None:
-            for key in reader.fields.keys():
-                if 'head_count' in key:
-                    head_count = get_field_value(key)
-                    if head_count is not None:
-                        break
-        result["head_count"] = head_count if head_count is not None else "unknown"
+        found = {
+            "context_length": ctx_length,
+            "layer_count": get_field_value(f"{arch}.block_count"),
+            "embedding_length": get_field_value(f"{arch}.embedding_length"),
+            "head_count": get_field_value(f"{arch}.attention.head_count"),
+        }
+
+        # For anything still missing, make one pass over the field names and take the first
+        # matching key that has a value. Context length matches on the ".context_length"
+        # suffix so look-alikes such as "<arch>.rope.scaling.original_context_length" are skipped.
+        matchers = {
+            "context_length": lambda key: key.endswith(".context_length"),
+            "layer_count": lambda key: "block_count" in key,
+            "embedding_length": lambda key: "embedding_length" in key,
+            "head_count": lambda key: "head_count" in key,
+        }
+        missing = {slot: matchers[slot] for slot, value in found.items() if value is None}
+        if missing:
+            for key in field_names:
+                for slot, matches in list(missing.items()):
+                    if matches(key):
+                        value = get_field_value(key)
+                        if value is not None:
+                            found[slot] = value
+                            del missing[slot]
+                if not missing:
+                    break
+
+        for slot, value in found.items():
+            result[slot] = value if value is not None else "unknown"
 
         # Quantization - always use filename heuristic as it's most reliable
         quant = self._guess_quantization(result["filename"])
@@ -1164,6 +1894,9 @@ class LlamaServerLauncher:
             verbose=False,
             n_ctx=0,
             n_gpu_layers=0,
+            # Only metadata is read - keep the context setup as small as possible
+            n_batch=1,
+            n_threads=1,
         )
 
         # Extract metadata from the model
@@ -1203,85 +1936,96 @@ class LlamaServerLauncher:
 
         return result
 
-    def _guess_quantization(self, filename: str) -> str:
-        """Guess quantization type from filename."""
-        filename_upper = filename.upper()
-        quant_types = [
-            "Q8_0", "Q6_K", "Q5_K_M", "Q5_K_S", "Q5_0", "Q5_1",
-            "Q4_K_M", "Q4_K_S", "Q4_0", "Q4_1",
-            "Q3_K_M", "Q3_K_S", "Q3_K_L",
-            "Q2_K", "IQ4_XS", "IQ3_XXS", "IQ2_XXS",
-            "F16", "F32", "BF16"
-        ]
-        for qt in quant_types:
-            if qt in filename_upper or qt.replace("_", "-") in filename_upper:
+    # Quantization types in match priority order
+    QUANT_TYPES = (
+        "Q8_0", "Q6_K", "Q5_K_M", "Q5_K_S", "Q5_0", "Q5_1",
+        "Q4_K_M", "Q4_K_S", "Q4_0", "Q4_1",
+        "Q3_K_M", "Q3_K_S", "Q3_K_L",
+        "Q2_K", "IQ4_XS", "IQ3_XXS", "IQ2_XXS",
+        "F16", "F32", "BF16"
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _guess_quantization(filename: str) -> str:
+        """Guess quantization type from filename (memoized - model names repeat across selections)."""
+        # Normalize dashes once so each type needs a single substring test
+        filename_upper = filename.upper().replace("-", "_")
+        for qt in LlamaServerLauncher.QUANT_TYPES:
+            if qt in filename_upper:
                 return qt
         return "unknown"
 
+    # Model info line: (analysis result key, display template), shown when known
+    MODEL_INFO_SPEC = (
+        ("architecture", "Arch: {}"),
+        ("layer_count", "Layers: {}"),
+        ("context_length", "Ctx: {}"),
+        ("file_size_gb", "Size: {} GB"),
+        ("quantization", "Quant: {}"),
+    )
+
     def _update_ui_after_analysis(self, result: Dict[str, Any]):
         """Update UI elements after GGUF analysis completes."""
         if "error" in result:
             info_text = f"⚠ {result.get('filename', 'Unknown')}: {result['error']}"
-            self.model_info_var.set(info_text)
+            self._set_model_info(info_text)
             return
 
         # Build info string
-        parts = []
-
-        # Architecture
-        if result.get("architecture") and result["architecture"] != "unknown":
-            parts.append(f"Arch: {result['architecture']}")
-
-        # Layers
-        if result.get("layer_count") and result["layer_count"] != "unknown":
-            parts.append(f"Layers: {result['layer_count']}")
-
-        # Context length
-        if result.get("context_length") and result["context_length"] != "unknown":
-            ctx = result["context_length"]
-            if isinstance(ctx, int) and ctx >= 1024:
-                ctx_display = f"{ctx // 1024}K"
-            else:
-                ctx_display = str(ctx)
-            parts.append(f"Ctx: {ctx_display}")
-
-        # File size
-        if result.get("file_size_gb"):
-            parts.append(f"Size: {result['file_size_gb']} GB")
-
-        # Quantization
-        if result.get("quantization") and result["quantization"] != "unknown":
-            parts.append(f"Quant: {result['quantization']}")
-
-        if parts:
-            info_text = " │ ".join(parts)
-        else:
-            info_text = f"Size: {result.get('file_size_gb', '?')} GB"
+        values = result
+        ctx = result.get("context_length")
+        if isinstance(ctx, int) and ctx >= 1024:
+            values = {**result, "context_length": f"{ctx // 1024}K"}
+        info_text = " │ ".join(
+            template.format(values[key])
+            for key, template in self.MODEL_INFO_SPEC
+            if values.get(key) and values[key] != "unknown"
+        ) or f"Size: {result.get('file_size_gb', '?')} GB"
 
         # Add warning if llama-cpp-python not available
         if result.get("warning"):
             info_text = f"Size: {result.get('file_size_gb', '?')} GB │ ⚠ {result['warning']}"
 
-        self.model_info_var.set(info_text)
+        self._set_model_info(info_text)
 
         # Store analysis result for potential use (e.g., setting max layers)
         self.last_analysis_result = result
 
+    def _set_model_info(self, text: str):
+        """Set the model info label, skipping the Tcl write (and redraw) if the text is unchanged."""
+        if text != self._last_model_info:
+            self.model_info_var.set(text)
+            self._last_model_info = text
+
     def _start_analysis(self, model_path: str):
         """Start GGUF analysis in a background thread."""
+        # Reselecting the file that is shown (or still being analyzed) needs no work
+        if self.current_analysis_path == model_path:
+            return
+
         # Cancel any ongoing analysis for a different file
-        if self.current_analysis_path != model_path:
-            self.current_analysis_path = model_path
-            self.model_info_var.set("Analyzing model...")
+        self.current_analysis_path = model_path
 
-            def analysis_worker():
-                result = self._run_gguf_analysis(model_path)
-                # Schedule UI update on main thread
-                if self.current_analysis_path == model_path:  # Still relevant
-                    self.root.after(0, lambda: self._update_ui_after_analysis(result))
+        # Known and unchanged on disk: render straight from the cache, no worker thread
+        try:
+            cached = self._lookup_meta_cache(model_path, os.stat(model_path))
+        except OSError:
+            cached = None
+        if cached is not None:
+            self._update_ui_after_analysis(cached)
+            return
+
+        self._set_model_info("Analyzing model...")
 
-            self.analysis_thread = threading.Thread(target=analysis_worker, daemon=True)
-            self.analysis_thread.start()
+        def analysis_worker():
+            result = self._run_gguf_analysis(model_path)
+            # Schedule UI update on main thread
+            if self.current_analysis_path == model_path:  # Still relevant
+                self.root.after(0, lambda: self._update_ui_after_analysis(result))
+
+        self.analysis_thread = threading.Thread(target=analysis_worker, daemon=True)
+        self.analysis_thread.start()
 
     def toggle_favorite(self):
         """Toggle favorite status for the selected model."""
@@ -1305,9 +2049,9 @@ class LlamaServerLauncher:
         self.update_favorite_ui()
         self.save_config()
 
-        # Refresh list to update star markers while preserving selection
+        # Re-apply the filter to update star markers while preserving selection
         current_selection = os.path.basename(model_path)
-        self.refresh_gguf_list()
+        self._apply_filter()
         # Restore selection with appropriate star prefix
         combo_values = list(self.gguf_combo["values"])
         for display_name in combo_values:
@@ -1322,7 +2066,7 @@ class LlamaServerLauncher:
         if not model_path:
             return
 
-        note = SafeVar.get_str(self.note_var)
+        note = self.note_var.get_str()
 
         # If model is not in favorites but has a note, add to favorites
         if model_path not in self.favorites:
@@ -1334,9 +2078,9 @@ class LlamaServerLauncher:
                 self.update_favorite_ui()
                 self.status_var.set(f"Note saved and added to favorites")
 
-                # Refresh list to show star marker
+                # Re-apply the filter to show star marker
                 current_selection = os.path.basename(model_path)
-                self.refresh_gguf_list()
+                self._apply_filter()
                 # Restore selection with star prefix
                 combo_values = list(self.gguf_combo["values"])
                 for display_name in combo_values:
@@ -1367,21 +2111,22 @@ class LlamaServerLauncher:
 
     def on_gguf_selected(self, event=None):
         """Handle GGUF file selection."""
-        selected = SafeVar.get_str(self.selected_gguf_var)
+        selected = self.selected_gguf_var.get_str()
         if selected:
             # Remove star prefix if present
             if selected.startswith("★ "):
                 selected = selected[2:]
                 self.selected_gguf_var.set(selected)
 
-            full_path = os.path.join(SafeVar.get_str(self.gguf_dir_var), selected)
+            full_path = os.path.join(self.gguf_dir_var.get_str(), selected)
             self.load_settings_for_model(full_path)
 
             # Default model alias to GGUF filename (without extension and path)
-            if not SafeVar.get_str(self.model_alias_var):
+            if not self.model_alias_var.get_str():
                 # Get base filename and remove .gguf extension
                 base_name = os.path.basename(selected)
-                model_name = base_name[:-5] if base_name.lower().endswith(".gguf") else base_name
+                stem, ext = os.path.splitext(base_name)
+                model_name = stem if ext.lower() == ".gguf" else base_name
                 self.model_alias_var.set(model_name)
 
             # Start GGUF analysis in background
@@ -1393,13 +2138,13 @@ class LlamaServerLauncher:
             # Update active preset label
             self.update_active_preset_label()
 
-            self.update_command_preview()
+            self.schedule_preview_update()
             self.status_var.set(f"Selected: {selected}")
 
     def get_model_full_path(self) -> str:
         """Get the full path of the selected model."""
-        gguf_dir = SafeVar.get_str(self.gguf_dir_var)
-        selected = SafeVar.get_str(self.selected_gguf_var)
+        gguf_dir = self.gguf_dir_var.get_str()
+        selected = self.selected_gguf_var.get_str()
         # Remove star prefix if present
         if selected.startswith("★ "):
             selected = selected[2:]
@@ -1409,163 +2154,51 @@ class LlamaServerLauncher:
 
     def build_command(self) -> list[str]:
         """Build the command arguments list."""
-        cmd = [SafeVar.get_str(self.llama_server_path_var)]
-
-        model_path = self.get_model_full_path()
-        if model_path:
-            cmd.extend(["-m", model_path])
-
-        # Common parameters
-        host = SafeVar.get_str(self.host_var)
-        if host:
-            cmd.extend(["--host", host])
-
-        port = SafeVar.get_str(self.port_var)
-        if port:
-            cmd.extend(["--port", port])
-
-        ngl = SafeVar.get_str(self.ngl_var)
-        if ngl:
-            cmd.extend(["-ngl", ngl])
-
-        ncmoe = SafeVar.get_str(self.ncmoe_var)
-        if ncmoe:
-            cmd.extend(["-ncmoe", ncmoe])
-
-        if self.jinja_var.get():
-            cmd.append("--jinja")
-
-        threads = SafeVar.get_str(self.threads_var)
-        if threads:
-            cmd.extend(["--threads", threads])
-
-        ctx_size = SafeVar.get_str(self.ctx_size_var)
-        if ctx_size:
-            cmd.extend(["--ctx-size", ctx_size])
-
-        temp = SafeVar.get_str(self.temp_var)
-        if temp:
-            cmd.extend(["--temp", temp])
-
-        min_p = SafeVar.get_str(self.min_p_var)
-        if min_p:
-            cmd.extend(["--min-p", min_p])
-
-        top_p = SafeVar.get_str(self.top_p_var)
-        if top_p:
-            cmd.extend(["--top-p", top_p])
-
-        top_k = SafeVar.get_str(self.top_k_var)
-        if top_k:
-            cmd.extend(["--top-k", top_k])
-
-        presence_penalty = SafeVar.get_str(self.presence_penalty_var)
-        if presence_penalty:
-            cmd.extend(["--presence-penalty", presence_penalty])
-
-        # Additional parameters
-        mmproj = SafeVar.get_str(self.mmproj_path_var)
-        if mmproj:
-            cmd.extend(["--mmproj", mmproj])
-
-        # OpenAI-compatible API settings
-        api_key = SafeVar.get_str(self.api_key_var)
-        if api_key:
-            cmd.extend(["--api-key", api_key])
-
-        model_alias = SafeVar.get_str(self.model_alias_var)
-        if model_alias:
-            cmd.extend(["--alias", model_alias])
-
-        chat_template = SafeVar.get_str(self.chat_template_var)
-        if chat_template:
-            cmd.extend(["--chat-template", chat_template])
-
-        chat_template_file = SafeVar.get_str(self.chat_template_file_var)
-        if chat_template_file:
-            cmd.extend(["--chat-template-file", chat_template_file])
-
-        batch_size = SafeVar.get_str(self.batch_size_var)
-        if batch_size:
-            cmd.extend(["-b", batch_size])
-
-        ubatch_size = SafeVar.get_str(self.ubatch_size_var)
-        if ubatch_size:
-            cmd.extend(["-ub", ubatch_size])
-
-        parallel = SafeVar.get_str(self.parallel_var)
-        if parallel:
-            cmd.extend(["--parallel", parallel])
-
-        n_predict = SafeVar.get_str(self.n_predict_var)
-        if n_predict:
-            cmd.extend(["-n", n_predict])
-
-        repeat_penalty = SafeVar.get_str(self.repeat_penalty_var)
-        if repeat_penalty:
-            cmd.extend(["--repeat-penalty", repeat_penalty])
-
-        frequency_penalty = SafeVar.get_str(self.frequency_penalty_var)
-        if frequency_penalty:
-            cmd.extend(["--frequency-penalty", frequency_penalty])
-
-        rope_freq_base = SafeVar.get_str(self.rope_freq_base_var)
-        if rope_freq_base:
-            cmd.extend(["--rope-freq-base", rope_freq_base])
-
-        rope_freq_scale = SafeVar.get_str(self.rope_freq_scale_var)
-        if rope_freq_scale:
-            cmd.extend(["--rope-freq-scale", rope_freq_scale])
-
-        # KV Cache settings
-        cache_type_k = SafeVar.get_str(self.cache_type_k_var)
-        if cache_type_k:
-            cmd.extend(["--cache-type-k", cache_type_k])
-
-        cache_type_v = SafeVar.get_str(self.cache_type_v_var)
-        if cache_type_v:
-            cmd.extend(["--cache-type-v", cache_type_v])
-
-        # Speculative decoding settings
-        if self.spec_type_enabled_var.get():
-            cmd.extend(["--spec-type", SafeVar.get_str(self.spec_type_var)])
-
-        if self.spec_draft_n_max_enabled_var.get():
-            cmd.extend(["--spec-draft-n-max", SafeVar.get_str(self.spec_draft_n_max_var)])
-
-        # Flags
-        if self.flash_attn_var.get():
-            cmd.extend(["-fa", "on"])
+        return list(self._command_tuple())
 
-        if self.mlock_var.get():
-            cmd.append("--mlock")
+    def _command_tuple(self) -> tuple[str, ...]:
+        """Build the command arguments as a (shared, memoized) tuple."""
+        if self._cmd_dirty or self._cmd_cache is None:
+            snapshot = (self.get_model_full_path(), tuple(self._snapshot().items()))
+            self._cmd_cache = self._build_command_cached(snapshot)
+            self._cmd_dirty = False
+        return self._cmd_cache
 
-        if self.no_mmap_var.get():
-            cmd.append("--no-mmap")
+    def _mark_command_dirty(self, *args):
+        """Invalidate the cached command after a write to one of its inputs."""
+        self._cmd_dirty = True
 
-        if self.cont_batching_var.get():
-            cmd.append("-cb")
-
-        if self.metrics_var.get():
-            cmd.append("--metrics")
-
-        if self.verbose_var.get():
-            cmd.append("--verbose")
-
-        if self.log_disable_var.get():
-            cmd.append("--log-disable")
-
-        if self.no_mmproj_offload_var.get():
-            cmd.append("--no-mmproj-offload")
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _build_command_cached(snapshot: tuple) -> tuple[str, ...]:
+        """
+        Build the command arguments from a (model path, variable items) snapshot.
+        Pure function of its input, so results are memoized while nothing changes.
+        """
+        model_path, items = snapshot
+        values = dict(items)
+        cmd = [values["llama_server_path_var"]]
 
-        if self.no_mmproj_var.get():
-            cmd.append("--no-mmproj")
+        if model_path:
+            cmd.extend(["-m", model_path])
 
-        if self.cpu_moe_var.get():
-            cmd.append("--cpu-moe")
+        for flag, attr, kind, extra in LlamaServerLauncher.CMD_SPEC:
+            if kind == "str":
+                value = values[attr]
+                if value:
+                    cmd.extend([flag, value])
+            elif kind == "flag":
+                if values[attr]:
+                    cmd.append(flag)
+            elif kind == "flag_val":
+                if values[attr]:
+                    cmd.extend([flag, extra])
+            elif kind == "gated":
+                if values[extra]:
+                    cmd.extend([flag, values[attr]])
 
         # Custom arguments - use shlex.split to properly handle quoted strings
-        custom = SafeVar.get_str(self.custom_args_var)
+        custom = values["custom_args_var"]
         if custom:
             try:
                 cmd.extend(shlex.split(custom))
@@ -1573,45 +2206,73 @@ class LlamaServerLauncher:
                 # If shlex.split fails (e.g., unclosed quotes), fall back to simple split
                 cmd.extend(custom.split())
 
-        return cmd
+        return tuple(cmd)
 
     def build_command_string(self) -> str:
         """Build a formatted command string for display."""
-        cmd = self.build_command()
+        return self._command_display(self._command_tuple())
+
+    def _command_display(self, cmd: tuple[str, ...]) -> str:
+        """Format a command tuple for display."""
         if len(cmd) < 2:
             return "# No model selected"
+        return self._format_command(cmd)
 
-        def quote_if_needed(s: str) -> str:
-            """Quote string if it contains special characters."""
-            if not s:
-                return s
-            # Use shlex.quote for proper shell escaping
-            # Include * ? [ ] for glob patterns, and other shell special chars
-            if any(c in s for c in ' \t\n\'"\\$`!*?[]{}();&|<>'):
-                return shlex.quote(s)
+    @staticmethod
+    def _quote_if_needed(s: str) -> str:
+        """Quote string if it contains special characters."""
+        if not s:
             return s
+        # Use shlex.quote for proper shell escaping
+        if not _SHELL_SPECIAL_CHARS.isdisjoint(s):
+            return shlex.quote(s)
+        return s
 
-        # Format with line continuations
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _format_command(cmd: tuple[str, ...]) -> str:
+        """Format a command tuple with line continuations, one option per line (memoized)."""
+        quote = LlamaServerLauncher._quote_if_needed
         lines = [cmd[0]]  # Executable
         i = 1
-        while i < len(cmd):
-            if cmd[i].startswith("-"):
-                if i + 1 < len(cmd) and not cmd[i + 1].startswith("-"):
-                    lines.append(f"  {cmd[i]} {quote_if_needed(cmd[i + 1])}")
+        n = len(cmd)
+        while i < n:
+            arg = cmd[i]
+            if arg.startswith("-"):
+                if i + 1 < n and not cmd[i + 1].startswith("-"):
+                    lines.append(f"  {arg} {quote(cmd[i + 1])}")
                     i += 2
                 else:
-                    lines.append(f"  {cmd[i]}")
+                    lines.append(f"  {arg}")
                     i += 1
             else:
-                lines.append(f"  {quote_if_needed(cmd[i])}")
+                lines.append(f"  {quote(arg)}")
                 i += 1
 
         return " \\\n".join(lines)
 
-    def update_command_preview(self):
-        """Update the command preview text."""
-        self.command_text.delete("1.0", tk.END)
-        self.command_text.insert("1.0", self.build_command_string())
+    def schedule_preview_update(self, *args):
+        """Refresh the command preview 100 ms from now, coalescing bursts of changes into one rebuild."""
+        if self._preview_suspended:
+            return
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(100, self._do_update_preview)
+
+    def _do_update_preview(self):
+        """Run a scheduled preview refresh."""
+        self._preview_after_id = None
+        self.update_command_preview(force=False)
+
+    def update_command_preview(self, force: bool = True):
+        """Update the command preview text. Unless forced, skip the redraw when nothing changed."""
+        # Compare argv before formatting; the Text itself is only touched when the command changed
+        cmd = self._command_tuple()
+        if not force and cmd == self._last_preview_args:
+            return
+        # Single atomic replace rather than delete + insert
+        self.command_text.replace("1.0", "end-1c", self._command_display(cmd))
+        self._last_preview_args = cmd
 
     def copy_command(self):
         """Copy the command to clipboard."""
@@ -1623,7 +2284,7 @@ class LlamaServerLauncher:
     def launch_server(self):
         """Launch the llama-server."""
         # Validate
-        server_path = SafeVar.get_str(self.llama_server_path_var)
+        server_path = self.llama_server_path_var.get_str()
         if not server_path or not os.path.isfile(server_path):
             messagebox.showerror("Error", "Please select a valid llama-server executable")
             return
@@ -1642,60 +2303,86 @@ class LlamaServerLauncher:
 
         cmd = self.build_command()
 
-        if self.run_in_terminal_var.get():
+        if self._settings_shadow["run_in_terminal"]:
             # Run in terminal
             try:
-                # Try different terminal emulators
-                terminals = [
-                    ["gnome-terminal", "--", "bash", "-c"],
-                    ["konsole", "-e", "bash", "-c"],
-                    ["xfce4-terminal", "-e", "bash -c"],
-                    ["xterm", "-e", "bash", "-c"],
-                ]
+                # Probe again in case a terminal was installed since startup
+                if self._terminal_cmd is None:
+                    self._terminal_cmd = self._find_terminal()
+                if self._terminal_cmd is None:
+                    messagebox.showerror("Error", "No supported terminal emulator found")
+                    return
 
                 # Use shlex.quote for proper shell escaping of all arguments
                 cmd_str = " ".join(shlex.quote(c) for c in cmd)
                 full_cmd_str = f'{cmd_str}; echo "\\nPress Enter to close..."; read'
 
-                launched = False
-                for term_cmd in terminals:
-                    try:
-                        if term_cmd[0] == "gnome-terminal":
-                            subprocess.Popen(term_cmd + [full_cmd_str])
-                        else:
-                            subprocess.Popen(term_cmd + [full_cmd_str])
-                        launched = True
-                        break
-                    except FileNotFoundError:
-                        continue
-
-                if launched:
-                    self.status_var.set("Server launched in terminal")
-                    self.show_api_info()
-                else:
-                    messagebox.showerror("Error", "No supported terminal emulator found")
+                subprocess.Popen(self._terminal_cmd + [full_cmd_str])
+                self.status_var.set("Server launched in terminal")
+                self.show_api_info()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to launch server: {e}")
         else:
-            # Run in background
+            # Run in background - one server at a time, so its output pipe and log stay its own
+            if self._stopping_process is not None or (self.server_process is not None and self.server_process.poll() is None):
+                messagebox.showerror("Error", "A background server is still running. Stop it before launching another one.")
+                return
             try:
+                # No preexec_fn or uid/gid changes, so CPython spawns via vfork() on
+                # Linux and never copies the GUI's page tables. start_new_session is
+                # kept so the server gets its own process group for kill_server.
                 self.server_process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=0,
                     start_new_session=True
                 )
-                self.status_var.set(f"Server launched in background (PID: {self.server_process.pid})")
+
+                # Stop showing output from any previous run and start a fresh log
+                if self._output_poll_id is not None:
+                    self.root.after_cancel(self._output_poll_id)
+                self.server_log_text.configure(state="normal")
+                self.server_log_text.delete("1.0", tk.END)
+                self.server_log_text.configure(state="disabled")
+
+                # Drain the pipe continuously so the server never blocks on a full buffer
+                output_queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+                try:
+                    # A fresh, private (0600) file per run; unbuffered so it stays current
+                    # even if the launcher is killed
+                    log_fd, log_path = tempfile.mkstemp(prefix="llama-server-", suffix=".log")
+                    log_file = open(log_fd, "wb", buffering=0)
+                except OSError:
+                    log_file = None
+                threading.Thread(target=self._read_server_output, args=(self.server_process, output_queue, log_file), daemon=True).start()
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                self._output_poll_id = self.root.after(100, self._drain_server_output, self.server_process, output_queue, decoder)
+
+                status = f"Server launched in background (PID: {self.server_process.pid})"
+                if log_file is not None:
+                    status += f" - log: {log_path}"
+                self.status_var.set(status)
                 self.show_api_info()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to launch server: {e}")
 
+    def _find_terminal(self) -> Optional[list[str]]:
+        """Return the launch prefix for the first installed terminal emulator, or None."""
+        for term_cmd in TERMINALS:
+            path = shutil.which(term_cmd[0])
+            if path:
+                return [path] + term_cmd[1:]
+        return None
+
     def show_api_info(self):
         """Show OpenAI-compatible API endpoint information."""
-        host = SafeVar.get_str(self.host_var) or "localhost"
-        port = SafeVar.get_str(self.port_var) or "8033"
-        api_key = SafeVar.get_str(self.api_key_var)
-        model_alias = SafeVar.get_str(self.model_alias_var) or "default"
+        # Read from the trace-maintained settings shadow rather than the Tcl variables
+        settings = self._settings_shadow
+        host = settings["host"] or "localhost"
+        port = settings["port"] or "8033"
+        api_key = settings["api_key"]
+        model_alias = settings["model_alias"] or "default"
 
         # Use localhost for display if bound to all interfaces
         display_host = "localhost" if host == "0.0.0.0" else host
@@ -1733,11 +2420,25 @@ response = client.chat.completions.create(
 print(response.choices[0].message.content)
 """
 
-        # Create info dialog
+        self._api_base_url = f"{base_url}/v1"
+        if self._api_info_window is None:
+            self._build_api_info_window()
+        else:
+            self._api_info_window.deiconify()
+            self._api_info_window.lift()
+
+        text = self._api_info_text
+        text.configure(state="normal")
+        text.replace("1.0", "end-1c", info)
+        text.configure(state="disabled")
+
+    def _build_api_info_window(self):
+        """Create the API info dialog once; closing it only withdraws it."""
         info_window = tk.Toplevel(self.root)
         info_window.title("API Endpoint Information")
         info_window.geometry("550x580")
         info_window.transient(self.root)
+        info_window.protocol("WM_DELETE_WINDOW", info_window.withdraw)
 
         # Text widget with scrollbar
         frame = ttk.Frame(info_window, padding="10")
@@ -1750,147 +2451,151 @@ print(response.choices[0].message.content)
         text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        text.insert("1.0", info)
-        text.configure(state="disabled")
-
         # Buttons
         btn_frame = ttk.Frame(info_window)
         btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
 
         def copy_base_url():
             self.root.clipboard_clear()
-            self.root.clipboard_append(f"{base_url}/v1")
+            self.root.clipboard_append(self._api_base_url)
             self.status_var.set("Base URL copied to clipboard")
 
         ttk.Button(btn_frame, text="Copy Base URL", command=copy_base_url).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(btn_frame, text="Close", command=info_window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(btn_frame, text="Close", command=info_window.withdraw).pack(side=tk.RIGHT)
+
+        self._api_info_window = info_window
+        self._api_info_text = text
 
     def kill_server(self):
         """Kill the llama-server process."""
+        # A second click while our server is still shutting down escalates to SIGKILL
+        if self._stopping_process is not None:
+            process, self._stopping_process = self._stopping_process, None
+            self._force_kill_server(process)
+            self.status_var.set("Background server killed")
+            return
+
         # First try to kill our own process
         if self.server_process is not None:
+            process = self.server_process
             try:
-                self.server_process.terminate()
-                self.server_process.wait(timeout=5)
-                self.status_var.set("Background server stopped")
+                # The server was started in its own session, so its pid is also its
+                # process group - signal the whole group to catch any children
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                # Already exited - reap it
+                process.poll()
                 self.server_process = None
-                return
-            except subprocess.TimeoutExpired:
-                self.server_process.kill()
-                self.server_process = None
-                self.status_var.set("Background server killed")
+                self.status_var.set("Background server stopped")
                 return
             except Exception as e:
+                # Keep the handle so the stop can be retried
                 self.status_var.set(f"Error stopping server: {e}")
+                return
+            # Only drop the handle once the signal has been sent
+            self.server_process = None
+            self._stopping_process = process
+            self.status_var.set("Stopping background server...")
+            # Poll for exit from the event loop instead of blocking in wait()
+            self.root.after(100, self._check_server_exit, process, 50)
+            return
 
-        # If no background process, ask about using pkill
+        # If no background process, offer to stop every llama-server instead
+        if PSUTIL_AVAILABLE:
+            method = ("This will send SIGTERM to every process whose command line contains "
+                      "'llama-server', then SIGKILL any still running after 5 seconds.")
+        else:
+            method = "This will use 'pkill -f llama-server' to terminate any running instances."
         result = messagebox.askyesno(
             "Kill llama-server",
-            "No background server found. Do you want to kill ALL running llama-server processes?\n\n"
-            "This will use 'pkill llama-server' to terminate any running instances.",
+            "No background server found. Do you want to kill ALL running llama-server processes?\n\n" + method,
             icon="warning"
         )
 
         if result:
+            if PSUTIL_AVAILABLE:
+                self.status_var.set("Stopping all llama-server processes...")
+                threading.Thread(target=self._kill_all_servers, daemon=True).start()
+                return
             try:
                 subprocess.run(["pkill", "-f", "llama-server"], check=False)
                 self.status_var.set("Sent kill signal to all llama-server processes")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to kill processes: {e}")
 
+    def _post_status(self, message: str):
+        """Set the status bar from a worker thread (ignored once the window is gone)."""
+        try:
+            self.root.after(0, self.status_var.set, message)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _check_server_exit(self, process: subprocess.Popen, polls_left: int):
+        """Poll a terminated background server every 100 ms, sending SIGKILL once the polls run out."""
+        if self._stopping_process is not process:
+            # Already dealt with (killed by a second click on Kill)
+            return
+        if process.poll() is None:
+            if polls_left > 0:
+                self.root.after(100, self._check_server_exit, process, polls_left - 1)
+                return
+            self._force_kill_server(process)
+            self.status_var.set("Background server killed")
+        else:
+            self.status_var.set("Background server stopped")
+        self._stopping_process = None
+
+    def _force_kill_server(self, process: subprocess.Popen):
+        """SIGKILL a background server's process group and reap it."""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def _kill_all_servers(self):
+        """Terminate every llama-server process via psutil, escalating to kill after 5 s (worker thread)."""
+        own_pid = os.getpid()
+        procs = []
+        for proc in psutil.process_iter(["cmdline"]):
+            # Match on the full command line, like pkill -f
+            cmdline = proc.info["cmdline"] or []
+            if proc.pid != own_pid and "llama-server" in " ".join(cmdline):
+                try:
+                    proc.terminate()
+                    procs.append(proc)
+                except psutil.Error:
+                    pass
+
+        _, alive = psutil.wait_procs(procs, timeout=5)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        self._post_status(f"Stopped {len(procs)} llama-server process(es)")
+
     def get_current_settings(self) -> dict:
         """Get all current settings as a dictionary."""
-        return {
-            "host": SafeVar.get_str(self.host_var),
-            "port": SafeVar.get_str(self.port_var),
-            "ngl": SafeVar.get_str(self.ngl_var),
-            "ncmoe": SafeVar.get_str(self.ncmoe_var),
-            "jinja": self.jinja_var.get(),
-            "threads": SafeVar.get_str(self.threads_var),
-            "ctx_size": SafeVar.get_str(self.ctx_size_var),
-            "temp": SafeVar.get_str(self.temp_var),
-            "min_p": SafeVar.get_str(self.min_p_var),
-            "top_p": SafeVar.get_str(self.top_p_var),
-            "top_k": SafeVar.get_str(self.top_k_var),
-            "presence_penalty": SafeVar.get_str(self.presence_penalty_var),
-            "mmproj": SafeVar.get_str(self.mmproj_path_var),
-            "api_key": SafeVar.get_str(self.api_key_var),
-            "model_alias": SafeVar.get_str(self.model_alias_var),
-            "chat_template": SafeVar.get_str(self.chat_template_var),
-            "chat_template_file": SafeVar.get_str(self.chat_template_file_var),
-            "batch_size": SafeVar.get_str(self.batch_size_var),
-            "ubatch_size": SafeVar.get_str(self.ubatch_size_var),
-            "parallel": SafeVar.get_str(self.parallel_var),
-            "n_predict": SafeVar.get_str(self.n_predict_var),
-            "repeat_penalty": SafeVar.get_str(self.repeat_penalty_var),
-            "frequency_penalty": SafeVar.get_str(self.frequency_penalty_var),
-            "rope_freq_base": SafeVar.get_str(self.rope_freq_base_var),
-            "rope_freq_scale": SafeVar.get_str(self.rope_freq_scale_var),
-            "cache_type_k": SafeVar.get_str(self.cache_type_k_var),
-            "cache_type_v": SafeVar.get_str(self.cache_type_v_var),
-            "flash_attn": self.flash_attn_var.get(),
-            "mlock": self.mlock_var.get(),
-            "no_mmap": self.no_mmap_var.get(),
-            "cont_batching": self.cont_batching_var.get(),
-            "metrics": self.metrics_var.get(),
-            "verbose": self.verbose_var.get(),
-            "log_disable": self.log_disable_var.get(),
-            "no_mmproj_offload": self.no_mmproj_offload_var.get(),
-            "no_mmproj": self.no_mmproj_var.get(),
-            "cpu_moe": self.cpu_moe_var.get(),
-            "custom_args": SafeVar.get_str(self.custom_args_var),
-            "spec_type_enabled": self.spec_type_enabled_var.get(),
-            "spec_type": SafeVar.get_str(self.spec_type_var),
-            "spec_draft_n_max_enabled": self.spec_draft_n_max_enabled_var.get(),
-            "spec_draft_n_max": SafeVar.get_str(self.spec_draft_n_max_var),
-            "run_in_terminal": self.run_in_terminal_var.get(),
-        }
+        # Served from the trace-maintained shadow, so no Tcl round-trips here
+        return dict(self._settings_shadow)
 
     def apply_settings(self, settings: dict):
         """Apply settings from a dictionary."""
-        self.host_var.set(settings.get("host", "0.0.0.0"))
-        self.port_var.set(settings.get("port", "8033"))
-        self.ngl_var.set(settings.get("ngl", "99"))
-        self.ncmoe_var.set(settings.get("ncmoe", ""))
-        self.jinja_var.set(settings.get("jinja", True))
-        self.threads_var.set(settings.get("threads", "-1"))
-        self.ctx_size_var.set(settings.get("ctx_size", "8192"))
-        self.temp_var.set(settings.get("temp", "0.7"))
-        self.min_p_var.set(settings.get("min_p", "0.0"))
-        self.top_p_var.set(settings.get("top_p", "0.9"))
-        self.top_k_var.set(settings.get("top_k", "40"))
-        self.presence_penalty_var.set(settings.get("presence_penalty", "0.0"))
-        self.mmproj_path_var.set(settings.get("mmproj", ""))
-        self.api_key_var.set(settings.get("api_key", ""))
-        self.model_alias_var.set(settings.get("model_alias", ""))
-        self.chat_template_var.set(settings.get("chat_template", ""))
-        self.chat_template_file_var.set(settings.get("chat_template_file", ""))
-        self.batch_size_var.set(settings.get("batch_size", ""))
-        self.ubatch_size_var.set(settings.get("ubatch_size", ""))
-        self.parallel_var.set(settings.get("parallel", ""))
-        self.n_predict_var.set(settings.get("n_predict", ""))
-        self.repeat_penalty_var.set(settings.get("repeat_penalty", ""))
-        self.frequency_penalty_var.set(settings.get("frequency_penalty", ""))
-        self.rope_freq_base_var.set(settings.get("rope_freq_base", ""))
-        self.rope_freq_scale_var.set(settings.get("rope_freq_scale", ""))
-        self.cache_type_k_var.set(settings.get("cache_type_k", ""))
-        self.cache_type_v_var.set(settings.get("cache_type_v", ""))
-        self.flash_attn_var.set(settings.get("flash_attn", False))
-        self.mlock_var.set(settings.get("mlock", False))
-        self.no_mmap_var.set(settings.get("no_mmap", False))
-        self.cont_batching_var.set(settings.get("cont_batching", True))
-        self.metrics_var.set(settings.get("metrics", False))
-        self.verbose_var.set(settings.get("verbose", False))
-        self.log_disable_var.set(settings.get("log_disable", False))
-        self.no_mmproj_offload_var.set(settings.get("no_mmproj_offload", False))
-        self.no_mmproj_var.set(settings.get("no_mmproj", False))
-        self.cpu_moe_var.set(settings.get("cpu_moe", False))
-        self.custom_args_var.set(settings.get("custom_args", ""))
-        self.spec_type_enabled_var.set(settings.get("spec_type_enabled", False))
-        self.spec_type_var.set(settings.get("spec_type", "draft-mtp"))
-        self.spec_draft_n_max_enabled_var.set(settings.get("spec_draft_n_max_enabled", False))
-        self.spec_draft_n_max_var.set(settings.get("spec_draft_n_max", "2"))
-        self.run_in_terminal_var.set(settings.get("run_in_terminal", True))
+        self._preview_suspended = True
+        try:
+            self._set_setting_vars(settings)
+        finally:
+            self._preview_suspended = False
+        self.schedule_preview_update()
+
+    def _set_setting_vars(self, settings: dict):
+        """Write every settings variable from a dictionary, using defaults for missing keys."""
+        for key, attr, default in self.SETTINGS_SPEC:
+            getattr(self, attr).set(settings.get(key, default))
 
     def save_current_settings(self):
         """Save current settings for the selected model."""
@@ -1929,20 +2634,40 @@ print(response.choices[0].message.content)
     def load_config(self) -> dict:
         """Load configuration from file."""
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, "r") as f:
-                    return json.load(f)
+            data = Path(CONFIG_FILE).read_bytes()
+            config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            if not isinstance(config, dict):
+                raise ValueError("expected a JSON object at the top level")
+            return config
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading config: {e}")
         return {}
 
+    def _schedule_save(self):
+        """Save the config 500 ms from now, coalescing repeated requests into one write."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._do_save)
+
+    def _do_save(self):
+        """Run a debounced config save."""
+        self._save_after_id = None
+        self.save_config()
+
     def save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file, skipping the write when nothing changed since the last one."""
+        # This write supersedes any pending debounced save
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
         try:
-            self.config["llama_server_path"] = SafeVar.get_str(self.llama_server_path_var)
-            self.config["last_gguf_dir"] = SafeVar.get_str(self.gguf_dir_var)
+            self.config["llama_server_path"] = self.llama_server_path_var.get_str()
+            self.config["last_gguf_dir"] = self.gguf_dir_var.get_str()
             # Strip star prefix from selected gguf before saving
-            selected = SafeVar.get_str(self.selected_gguf_var)
+            selected = self.selected_gguf_var.get_str()
             if selected.startswith("★ "):
                 selected = selected[2:]
             self.config["last_selected_gguf"] = selected
@@ -1950,8 +2675,18 @@ print(response.choices[0].message.content)
             self.config["presets"] = self.presets
             self.config["model_preset_map"] = self.model_preset_map
 
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(self.config, f, indent=2)
+            # Compact output: this runs on every settings save, so skip pretty-printing
+            data = orjson.dumps(self.config) if ORJSON_AVAILABLE else json.dumps(self.config).encode("utf-8")
+            if data == self._last_saved_config:
+                # Nothing changed since the last write
+                return
+
+            # Write to a temp file and swap it in so a crash never leaves a truncated config
+            tmp_path = CONFIG_FILE + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, CONFIG_FILE)
+            self._last_saved_config = data
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -1961,25 +2696,31 @@ print(response.choices[0].message.content)
         last_dir = self.config.get("last_gguf_dir", "")
         if last_dir and os.path.isdir(last_dir):
             self.gguf_dir_var.set(last_dir)
-            self.refresh_gguf_list()
-
-            # Select last used GGUF if still available
-            last_gguf = self.config.get("last_selected_gguf", "")
-            if last_gguf:
-                # Check if file exists in list (with or without star prefix)
-                combo_values = list(self.gguf_combo["values"])
-                if last_gguf in self.gguf_files:
-                    # Find the display name (might have star prefix)
-                    for display_name in combo_values:
-                        actual_name = display_name[2:] if display_name.startswith("★ ") else display_name
-                        if actual_name == last_gguf:
-                            self.selected_gguf_var.set(display_name)
-                            self.on_gguf_selected()
-                            break
+            # Select last used GGUF once the directory scan completes
+            self.refresh_gguf_list(on_complete=self.select_last_gguf)
+
+    def select_last_gguf(self):
+        """Select the last used GGUF if it is still available."""
+        last_gguf = self.config.get("last_selected_gguf", "")
+        # Check the full file list rather than the dropdown, which may be capped
+        if last_gguf and last_gguf in self.gguf_files:
+            # Use the same display form as the dropdown (favorites carry a star prefix)
+            full_path = os.path.join(self.gguf_dir_var.get_str(), last_gguf)
+            display_name = f"★ {last_gguf}" if full_path in self.favorites else last_gguf
+            self.selected_gguf_var.set(display_name)
+            self.on_gguf_selected()
 
     def on_close(self):
         """Handle application close."""
         self.save_config()
+        with self._meta_cache_lock:
+            flush_pending = self._meta_flush_timer is not None
+        if flush_pending:
+            self._flush_meta_cache()
+        else:
+            # A timer flush may already be writing - wait for it before exiting
+            with self._meta_flush_lock:
+                pass
 
         # Warn about background process
         if self.server_process is not None:
@@ -1993,6 +2734,15 @@ print(response.choices[0].message.content)
 
         self.root.destroy()
 
+        # The event loop is gone, so finish any pending stop here: give the server
+        # the rest of its grace period, then kill it
+        process = self._stopping_process
+        if process is not None:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._force_kill_server(process)
+
 
 def main():
     """Main entry point."""